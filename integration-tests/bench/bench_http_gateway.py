@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import argparse
 import http.client
-import json
 import sys
 import time
 from pathlib import Path
@@ -10,6 +9,7 @@ from pathlib import Path
 ROOT = Path(__file__).resolve().parents[2]
 sys.path.insert(0, str(ROOT / "sdk" / "python"))
 
+from aether._json import dumps, loads
 from aether.crypto import compute_event_id, generate_keypair, sign
 
 
@@ -24,37 +24,35 @@ def parse_args() -> argparse.Namespace:
 def main() -> None:
     args = parse_args()
     private_key, pubkey = generate_keypair()
+    pubkey_hex = pubkey.hex()
 
+    # One persistent connection, so the loop measures the relay rather than TCP setup.
     conn = http.client.HTTPConnection(args.host, args.port, timeout=10)
-    conn.request(
-        "POST",
-        "/v1/subscriptions",
-        body=json.dumps({"filters": {"kinds": [1]}}),
-        headers={"Content-Type": "application/json"},
-    )
-    sub = json.loads(conn.getresponse().read().decode("utf-8"))["subscription_id"]
-    conn.close()
+    headers = {"Content-Type": "application/json", "Connection": "keep-alive"}
+    conn.request("POST", "/v1/subscriptions", body=dumps({"filters": {"kinds": [1]}}), headers=headers)
+    sub = loads(conn.getresponse().read())["subscription_id"]
 
-    latencies: list[float] = []
+    bodies: list[bytes] = []
     for idx in range(args.count):
         event_id = compute_event_id(pubkey=pubkey, created_at=idx + 1, kind=1, tags=[], content=b"bench")
         event = {
             "event_id": event_id.hex(),
-            "pubkey": pubkey.hex(),
+            "pubkey": pubkey_hex,
             "kind": 1,
             "created_at": idx + 1,
             "tags": [],
             "content": "bench",
             "sig": sign(event_id, private_key).hex(),
         }
+        bodies.append(dumps({"event": event}))
+
+    latencies: list[float] = []
+    for body in bodies:
         start = time.perf_counter()
-        conn = http.client.HTTPConnection(args.host, args.port, timeout=10)
-        conn.request("POST", "/v1/events", body=json.dumps({"event": event}), headers={"Content-Type": "application/json"})
+        conn.request("POST", "/v1/events", body=body, headers=headers)
         conn.getresponse().read()
-        conn.close()
         latencies.append(time.perf_counter() - start)
 
-    conn = http.client.HTTPConnection(args.host, args.port, timeout=10)
     conn.request("DELETE", f"/v1/subscriptions/{sub}")
     conn.getresponse().read()
     conn.close()
@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import argparse
 import asyncio
-import json
 import time
 import sys
 from pathlib import Path
@@ -12,6 +11,7 @@ import websockets
 ROOT = Path(__file__).resolve().parents[2]
 sys.path.insert(0, str(ROOT / "sdk" / "python"))
 
+from aether._json import dumps, loads
 from aether.crypto import compute_event_id, generate_keypair, sign
 
 
@@ -19,40 +19,60 @@ def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser()
     parser.add_argument("--url", default="ws://127.0.0.1:7447")
     parser.add_argument("--count", type=int, default=100)
+    parser.add_argument("--depth", type=int, default=32, help="max EVENTs in flight")
     return parser.parse_args()
 
 
 async def main() -> None:
     args = parse_args()
     private_key, pubkey = generate_keypair()
-    latencies: list[float] = []
-    async with websockets.connect(args.url) as ws:
-        await ws.send(json.dumps(["REQ", "bench", {"kinds": [1]}]))
-        await ws.recv()
-        for idx in range(args.count):
-            event_id = compute_event_id(pubkey=pubkey, created_at=idx + 1, kind=1, tags=[], content=b"bench")
-            event = {
+    pubkey_hex = pubkey.hex()
+    events: list[dict[str, object]] = []
+    for idx in range(args.count):
+        event_id = compute_event_id(pubkey=pubkey, created_at=idx + 1, kind=1, tags=[], content=b"bench")
+        events.append(
+            {
                 "id": event_id.hex(),
-                "pubkey": pubkey.hex(),
+                "pubkey": pubkey_hex,
                 "kind": 1,
                 "created_at": idx + 1,
                 "tags": [],
                 "content": "bench",
                 "sig": sign(event_id, private_key).hex(),
             }
-            start = time.perf_counter()
-            await ws.send(json.dumps(["EVENT", event]))
-            await ws.recv()  # OK
-            await ws.recv()  # EVENT
-            latencies.append(time.perf_counter() - start)
+        )
+
+    sent_at: dict[str, float] = {}
+    latencies: list[float] = []
+    in_flight = asyncio.Semaphore(args.depth)
+    async with websockets.connect(args.url) as ws:
+        await ws.send(dumps(["REQ", "bench", {"kinds": [1]}]), text=True)
+        await ws.recv()
+
+        async def produce() -> None:
+            for event in events:
+                await in_flight.acquire()
+                sent_at[event["id"]] = time.perf_counter()  # type: ignore[index]
+                await ws.send(dumps(["EVENT", event]), text=True)
+
+        async def consume() -> None:
+            # EVENT echoes for the bench subscription are interleaved with the OKs.
+            while len(latencies) < len(events):
+                message = loads(await ws.recv(decode=False))
+                if message[0] == "OK":
+                    latencies.append(time.perf_counter() - sent_at.pop(message[1]))
+                    in_flight.release()
+
+        started = time.perf_counter()
+        await asyncio.gather(produce(), consume())
+        total = time.perf_counter() - started
 
     latencies.sort()
     p50 = latencies[len(latencies) // 2]
     p95 = latencies[int(len(latencies) * 0.95) - 1]
     p99 = latencies[int(len(latencies) * 0.99) - 1]
-    total = sum(latencies)
     print(
-        f"nostr events={args.count} total={total:.3f}s ev/s={args.count/total:.1f} "
+        f"nostr events={args.count} depth={args.depth} total={total:.3f}s ev/s={args.count/total:.1f} "
         f"p50={p50*1000:.2f}ms p95={p95*1000:.2f}ms p99={p99*1000:.2f}ms"
     )
 
@@ -15,6 +15,7 @@ def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser()
     parser.add_argument("--url", default="ws://127.0.0.1:9000")
     parser.add_argument("--count", type=int, default=100)
+    parser.add_argument("--chunk", type=int, default=64, help="publishes awaited together")
     return parser.parse_args()
 
 
@@ -24,31 +25,34 @@ async def main() -> None:
     await client.connect([args.url])
 
     private_key, pubkey = generate_keypair()
+    events = [_build_event(idx, private_key, pubkey) for idx in range(args.count)]
     start = time.perf_counter()
-    for idx in range(args.count):
-        created_at = idx + 1
-        content = f"bench-{idx}".encode("utf-8")
-        event_id = compute_event_id(
-            pubkey=pubkey,
-            created_at=created_at,
-            kind=1,
-            tags=[],
-            content=content,
-        )
-        sig = sign(event_id, private_key)
-        event = {
-            "event_id": event_id,
-            "pubkey": pubkey,
-            "kind": 1,
-            "created_at": created_at,
-            "tags": [],
-            "content": content.decode("utf-8"),
-            "sig": sig,
-        }
-        await client.publish(event)
+    for base in range(0, len(events), args.chunk):
+        await asyncio.gather(*(client.publish(event) for event in events[base : base + args.chunk]))
     elapsed = time.perf_counter() - start
     print(f"published {args.count} events in {elapsed:.3f}s ({args.count/elapsed:.1f} ev/s)")
 
 
+def _build_event(idx: int, private_key: bytes, pubkey: bytes) -> dict[str, object]:
+    created_at = idx + 1
+    content = f"bench-{idx}".encode("utf-8")
+    event_id = compute_event_id(
+        pubkey=pubkey,
+        created_at=created_at,
+        kind=1,
+        tags=[],
+        content=content,
+    )
+    return {
+        "event_id": event_id,
+        "pubkey": pubkey,
+        "kind": 1,
+        "created_at": created_at,
+        "tags": [],
+        "content": content.decode("utf-8"),
+        "sig": sign(event_id, private_key),
+    }
+
+
 if __name__ == "__main__":
     asyncio.run(main())
@@ -24,27 +24,9 @@ async def main() -> None:
     await client.connect([args.url])
 
     private_key, pubkey = generate_keypair()
+    events = [_build_event(idx, private_key, pubkey) for idx in range(args.count)]
     latencies = []
-    for idx in range(args.count):
-        created_at = idx + 1
-        content = f"bench-{idx}".encode("utf-8")
-        event_id = compute_event_id(
-            pubkey=pubkey,
-            created_at=created_at,
-            kind=1,
-            tags=[],
-            content=content,
-        )
-        sig = sign(event_id, private_key)
-        event = {
-            "event_id": event_id,
-            "pubkey": pubkey,
-            "kind": 1,
-            "created_at": created_at,
-            "tags": [],
-            "content": content.decode("utf-8"),
-            "sig": sig,
-        }
+    for event in events:
         start = time.perf_counter()
         await client.publish(event)
         latencies.append(time.perf_counter() - start)
@@ -57,5 +39,26 @@ async def main() -> None:
     print(f"p50={p50 * 1000:.2f}ms p95={p95 * 1000:.2f}ms p99={p99 * 1000:.2f}ms")
 
 
+def _build_event(idx: int, private_key: bytes, pubkey: bytes) -> dict[str, object]:
+    created_at = idx + 1
+    content = f"bench-{idx}".encode("utf-8")
+    event_id = compute_event_id(
+        pubkey=pubkey,
+        created_at=created_at,
+        kind=1,
+        tags=[],
+        content=content,
+    )
+    return {
+        "event_id": event_id,
+        "pubkey": pubkey,
+        "kind": 1,
+        "created_at": created_at,
+        "tags": [],
+        "content": content.decode("utf-8"),
+        "sig": sign(event_id, private_key),
+    }
+
+
 if __name__ == "__main__":
     asyncio.run(main())
@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import argparse
 import http.client
-import json
 import subprocess
 import sys
 import time
@@ -14,6 +13,7 @@ import asyncio
 ROOT = Path(__file__).resolve().parents[2]
 sys.path.insert(0, str(ROOT / "sdk" / "python"))
 
+from aether._json import dumps, loads
 from aether.crypto import compute_event_id, generate_keypair, sign
 
 
@@ -58,7 +58,7 @@ def _invalid_burst() -> None:
     async def run() -> None:
         async with websockets.connect("ws://127.0.0.1:7447") as ws:
             for _ in range(10):
-                await ws.send(json.dumps(["EVENT", {"bad": "event"}]))
+                await ws.send(dumps(["EVENT", {"bad": "event"}]), text=True)
                 await ws.recv()
 
     asyncio.run(run())
@@ -66,17 +66,21 @@ def _invalid_burst() -> None:
 
 
 def _slow_consumer_check() -> None:
+    # One keep-alive connection for the whole sweep; the gateway keeps it open.
     conn = http.client.HTTPConnection("127.0.0.1", 8081, timeout=10)
+    headers = {"Content-Type": "application/json", "Connection": "keep-alive"}
     conn.request(
         "POST",
         "/v1/subscriptions",
-        body=json.dumps({"filters": {"kinds": [1]}, "subscription_id": "slow-sub"}),
-        headers={"Content-Type": "application/json"},
+        body=dumps({"filters": {"kinds": [1]}, "subscription_id": "slow-sub"}),
+        headers=headers,
     )
     conn.getresponse().read()
-    conn.close()
 
     private_key, pubkey = generate_keypair()
+    # Only event_id, created_at and sig vary, so reuse one event dict.
+    event: dict[str, object] = {"pubkey": pubkey.hex(), "kind": 1, "tags": [], "content": "x"}
+    body = {"event": event}
     # produce many valid events without opening SSE stream to force queue growth/drop behavior.
     for idx in range(1100):
         event_id = compute_event_id(
@@ -86,31 +90,14 @@ def _slow_consumer_check() -> None:
             tags=[],
             content=b"x",
         )
-        conn = http.client.HTTPConnection("127.0.0.1", 8081, timeout=10)
-        conn.request(
-            "POST",
-            "/v1/events",
-            body=json.dumps(
-                {
-                    "event": {
-                        "event_id": event_id.hex(),
-                        "pubkey": pubkey.hex(),
-                        "kind": 1,
-                        "created_at": idx + 1,
-                        "tags": [],
-                        "content": "x",
-                        "sig": sign(event_id, private_key).hex(),
-                    }
-                }
-            ),
-            headers={"Content-Type": "application/json"},
-        )
+        event["event_id"] = event_id.hex()
+        event["created_at"] = idx + 1
+        event["sig"] = sign(event_id, private_key).hex()
+        conn.request("POST", "/v1/events", body=dumps(body), headers=headers)
         conn.getresponse().read()
-        conn.close()
 
-    conn = http.client.HTTPConnection("127.0.0.1", 8081, timeout=10)
-    conn.request("GET", "/healthz")
-    payload = json.loads(conn.getresponse().read().decode("utf-8"))
+    conn.request("GET", "/healthz", headers=headers)
+    payload = loads(conn.getresponse().read())
     conn.close()
     print(f"slow consumer check: dropped_messages={payload.get('dropped_messages', 0)}")
 
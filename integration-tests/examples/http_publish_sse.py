@@ -4,8 +4,8 @@ from __future__ import annotations
 
 import asyncio
 import http.client
-import json
 
+from aether._json import dumps, loads
 from aether.crypto import compute_event_id, generate_keypair, sign
 
 
@@ -14,11 +14,11 @@ def post_subscription() -> str:
     conn.request(
         "POST",
         "/v1/subscriptions",
-        body=json.dumps({"filters": {"kinds": [1]}}),
+        body=dumps({"filters": {"kinds": [1]}}),
         headers={"Content-Type": "application/json"},
     )
     resp = conn.getresponse()
-    payload = json.loads(resp.read().decode("utf-8"))
+    payload = loads(resp.read())
     conn.close()
     return str(payload["subscription_id"])
 
@@ -36,7 +36,7 @@ def post_event() -> None:
         "sig": sign(event_id, private_key).hex(),
     }
     conn = http.client.HTTPConnection("127.0.0.1", 8081, timeout=5)
-    conn.request("POST", "/v1/events", body=json.dumps({"event": event}), headers={"Content-Type": "application/json"})
+    conn.request("POST", "/v1/events", body=dumps({"event": event}), headers={"Content-Type": "application/json"})
     print("POST /v1/events ->", conn.getresponse().read().decode("utf-8"))
     conn.close()
 
@@ -3,10 +3,10 @@
 from __future__ import annotations
 
 import asyncio
-import json
 
 import websockets
 
+from aether._json import dumps
 from aether.crypto import compute_event_id, generate_keypair, sign
 
 
@@ -24,10 +24,10 @@ async def main() -> None:
     }
 
     async with websockets.connect("ws://127.0.0.1:7447") as ws:
-        await ws.send(json.dumps(["REQ", "sub-1", {"kinds": [1]}]))
+        # Pipeline both frames; the gateway answers them in order on this socket.
+        await ws.send(dumps(["REQ", "sub-1", {"kinds": [1]}]), text=True)
+        await ws.send(dumps(["EVENT", event]), text=True)
         print("REQ ->", await ws.recv())
-
-        await ws.send(json.dumps(["EVENT", event]))
         print("OK ->", await ws.recv())
         print("EVENT ->", await ws.recv())
 
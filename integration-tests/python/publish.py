@@ -1,5 +1,6 @@
 import argparse
 import asyncio
+import json
 import sys
 from pathlib import Path
 
@@ -16,6 +17,11 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--kind", type=int, default=1)
     parser.add_argument("--content", default="hello")
     parser.add_argument("--created-at", type=int, default=1)
+    parser.add_argument("--repeat", type=int, default=1, help="publish each signed event this many times")
+    parser.add_argument(
+        "--events-file",
+        help="JSONL of {kind, content, created_at} objects to publish over one connection ('-' for stdin)",
+    )
     return parser.parse_args()
 
 
@@ -25,25 +31,44 @@ async def main() -> None:
     await client.connect([args.url])
 
     private_key, pubkey = generate_keypair()
-    content = args.content.encode("utf-8")
+    # Sign each event once; --repeat replays it over the same connection.
+    events = [_build_event(spec, private_key, pubkey) for spec in _event_specs(args)]
+    for event in events:
+        for _ in range(args.repeat):
+            await client.publish(event)
+
+
+def _event_specs(args: argparse.Namespace) -> list[dict[str, object]]:
+    default = {"kind": args.kind, "content": args.content, "created_at": args.created_at}
+    if args.events_file is None:
+        return [default]
+    if args.events_file == "-":
+        lines = sys.stdin.read().splitlines()
+    else:
+        lines = Path(args.events_file).read_text(encoding="utf-8").splitlines()
+    return [{**default, **json.loads(line)} for line in lines if line.strip()]
+
+
+def _build_event(spec: dict[str, object], private_key: bytes, pubkey: bytes) -> dict[str, object]:
+    kind = int(spec["kind"])  # type: ignore[arg-type]
+    created_at = int(spec["created_at"])  # type: ignore[arg-type]
+    content = str(spec["content"]).encode("utf-8")
     event_id = compute_event_id(
         pubkey=pubkey,
-        created_at=args.created_at,
-        kind=args.kind,
+        created_at=created_at,
+        kind=kind,
         tags=[],
         content=content,
     )
-    sig = sign(event_id, private_key)
-    event = {
+    return {
         "event_id": event_id,
         "pubkey": pubkey,
-        "kind": args.kind,
-        "created_at": args.created_at,
+        "kind": kind,
+        "created_at": created_at,
         "tags": [],
         "content": content.decode("utf-8"),
-        "sig": sig,
+        "sig": sign(event_id, private_key),
     }
-    await client.publish(event)
 
 
 if __name__ == "__main__":
@@ -1,4 +1,5 @@
 import argparse
+import socket
 import subprocess
 import sys
 import time
@@ -17,20 +18,36 @@ def run_background(cmd: list[str]) -> subprocess.Popen:
     return subprocess.Popen(cmd)
 
 
+def wait_for_port(host: str, port: int, timeout: float = 10.0) -> None:
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            socket.create_connection((host, port), timeout=0.5).close()
+            return
+        except OSError:
+            if time.monotonic() >= deadline:
+                raise
+            time.sleep(0.05)
+
+
 def main() -> None:
     args = parse_args()
+    port = int(args.url.split(":")[-1])
 
+    # The SDK build does not need the relay, so run both at once.
+    build = run_background(["pnpm", "-C", str(ROOT / "sdk" / "typescript"), "build"])
     relay = run_background([
         sys.executable,
         str(ROOT / "integration-tests" / "run_relay.py"),
         "--host",
         "127.0.0.1",
         "--port",
-        args.url.split(":")[-1],
+        str(port),
     ])
     try:
-        time.sleep(1.0)
-        subprocess.run(["pnpm", "-C", str(ROOT / "sdk" / "typescript"), "build"], check=True)
+        wait_for_port("127.0.0.1", port)
+        if build.wait() != 0:
+            raise subprocess.CalledProcessError(build.returncode, build.args)
 
         ts_sub = run_background([
             "node",
@@ -50,31 +67,27 @@ def main() -> None:
             "5",
         ])
 
-        subprocess.run([
-            sys.executable,
-            str(ROOT / "integration-tests" / "python" / "publish.py"),
-            "--url",
-            args.url,
-            "--kind",
-            "1",
-            "--content",
-            "ignore",
-        ], check=True)
-        time.sleep(0.5)
-        subprocess.run([
-            sys.executable,
-            str(ROOT / "integration-tests" / "python" / "publish.py"),
-            "--url",
-            args.url,
-            "--kind",
-            "2",
-            "--content",
-            "match",
-        ], check=True)
+        # One publisher process and connection for both events; the non-matching
+        # kind 1 event goes first so subscribers must skip it.
+        subprocess.run(
+            [
+                sys.executable,
+                str(ROOT / "integration-tests" / "python" / "publish.py"),
+                "--url",
+                args.url,
+                "--events-file",
+                "-",
+            ],
+            input='{"kind": 1, "content": "ignore"}\n{"kind": 2, "content": "match"}\n',
+            text=True,
+            check=True,
+        )
 
         ts_sub.wait(timeout=6)
         py_sub.wait(timeout=6)
     finally:
+        if build.poll() is None:
+            build.terminate()
         relay.terminate()
         relay.wait(timeout=5)
 
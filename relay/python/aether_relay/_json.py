@@ -0,0 +1,36 @@
+"""JSON helpers that use orjson when installed and fall back to stdlib json.
+
+The two backends do not emit identical bytes for every input (float
+formatting, NaN, integers wider than 64 bits, non-ASCII escaping), so these
+are for wire frames only. Anything that is hashed or signed must use a fixed
+encoder instead.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Callable
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
+
+def dumps(
+    value: Any,
+    *,
+    sort_keys: bool = False,
+    default: Callable[[Any], Any] | None = None,
+) -> bytes:
+    """Serialize to compact UTF-8 JSON bytes."""
+
+    if orjson is not None:
+        return orjson.dumps(value, default=default, option=orjson.OPT_SORT_KEYS if sort_keys else 0)
+    return json.dumps(
+        value, separators=(",", ":"), sort_keys=sort_keys, ensure_ascii=False, default=default
+    ).encode("utf-8")
+
+
+# Bound once at import: decoding sits on every inbound frame.
+loads: Callable[[bytes | str], Any] = orjson.loads if orjson is not None else json.loads
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import Iterable
 
 from blake3 import blake3
 
@@ -18,26 +19,71 @@ class BloomFilter:
         if self.hash_count <= 0:
             raise ValueError("hash_count must be positive")
         self._bits = bytearray((self.size_bits + 7) // 8)
+        # Stores probe with might_contain() and then add() the same id; keep the
+        # last probe set so the second call skips the hash.
+        self._last_probe: tuple[bytes, tuple[int, ...]] | None = None
 
     def add(self, data: bytes) -> None:
+        bits = self._bits
         for index in self._indices(data):
-            self._set_bit(index)
+            bits[index >> 3] |= 1 << (index & 7)
+
+    def add_many(self, items: Iterable[bytes]) -> None:
+        bits = self._bits
+        probe = self._probe
+        for data in items:
+            for index in probe(data):
+                bits[index >> 3] |= 1 << (index & 7)
+
+    def update(self, other: BloomFilter) -> None:
+        """Merge another filter with the same size and hash count into this one."""
+
+        if other.size_bits != self.size_bits or other.hash_count != self.hash_count:
+            raise ValueError("bloom filter parameters must match")
+        # OR the whole vector as one integer instead of byte by byte.
+        merged = int.from_bytes(self._bits, "little") | int.from_bytes(other._bits, "little")
+        self._bits[:] = merged.to_bytes(len(self._bits), "little")
+
+    def __or__(self, other: BloomFilter) -> BloomFilter:
+        merged = BloomFilter(self.size_bits, self.hash_count)
+        merged._bits[:] = self._bits
+        merged.update(other)
+        return merged
+
+    def bit_count(self) -> int:
+        """Number of set bits, counted over the whole vector at once."""
+
+        return int.from_bytes(self._bits, "little").bit_count()
 
     def might_contain(self, data: bytes) -> bool:
-        return all(self._get_bit(index) for index in self._indices(data))
-
-    def _indices(self, data: bytes) -> list[int]:
-        indices: list[int] = []
-        for i in range(self.hash_count):
-            digest = blake3(data + i.to_bytes(2, "big")).digest()
-            value = int.from_bytes(digest[:8], "big")
-            indices.append(value % self.size_bits)
-        return indices
+        bits = self._bits
+        for index in self._indices(data):
+            if not bits[index >> 3] & (1 << (index & 7)):
+                return False
+        return True
 
-    def _set_bit(self, index: int) -> None:
-        byte_index, bit_index = divmod(index, 8)
-        self._bits[byte_index] |= 1 << bit_index
+    def _indices(self, data: bytes) -> tuple[int, ...]:
+        # Only immutable bytes are cached; a reused bytearray could change
+        # between the probe and the add.
+        if type(data) is not bytes:
+            return self._probe(data)
+        last = self._last_probe
+        if last is not None and last[0] == data:
+            return last[1]
+        indices = self._probe(data)
+        self._last_probe = (data, indices)
+        return indices
 
-    def _get_bit(self, index: int) -> bool:
-        byte_index, bit_index = divmod(index, 8)
-        return bool(self._bits[byte_index] & (1 << bit_index))
+    def _probe(self, data: bytes) -> tuple[int, ...]:
+        # Kirsch-Mitzenmacher: derive every index from one 128-bit digest
+        # instead of hashing once per probe.
+        digest = int.from_bytes(blake3(data).digest(16), "big")
+        size = self.size_bits
+        # Reduce both halves first so the probe loop stays on small ints.
+        index = (digest >> 64) % size
+        step = ((digest & 0xFFFFFFFFFFFFFFFF) | 1) % size
+        indices = []
+        for _ in range(self.hash_count):
+            indices.append(index)
+            index = (index + step) % size
+        return tuple(indices)
@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
+import logging
 from dataclasses import dataclass
 from typing import Awaitable, Callable, Mapping
 
+from ._json import dumps
+from .filters import normalize_filter
 from .limits import RateLimiter
 from .subscriptions import SubscriptionManager
 from .validation import validate_event
@@ -12,6 +16,8 @@ from .validation import validate_event
 SendFn = Callable[[str, Mapping[str, object]], Awaitable[None]]
 GossipFn = Callable[[bytes], Awaitable[None]]
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class RelayConfig:
@@ -27,10 +33,15 @@ class RelayCore:
         self._store = store
         self._config = config or RelayConfig()
         self._subscriptions = SubscriptionManager()
+        self._failed_deliveries = 0
 
-    def subscribe(self, connection_id: str, subscription_id: str, filters: list[object]) -> None:
-        from .filters import normalize_filter
+    @property
+    def failed_deliveries(self) -> int:
+        """Subscriber sends that raised during fan-out since startup."""
 
+        return self._failed_deliveries
+
+    def subscribe(self, connection_id: str, subscription_id: str, filters: list[object]) -> None:
         normalized = [normalize_filter(raw) for raw in filters]
         self._subscriptions.add(connection_id, subscription_id, normalized)
 
@@ -56,21 +67,19 @@ class RelayCore:
                 lambda conn_id, sub_id, evt: send(conn_id, {"type": "event", "sub_id": sub_id, "event": evt}),
             )
             if tasks:
-                await _gather_tasks(tasks)
+                # A closed or failing subscriber must not fail the publisher or
+                # cancel delivery to the others; its own connection handles cleanup.
+                results = await asyncio.gather(*tasks, return_exceptions=True)
+                for result in results:
+                    if isinstance(result, BaseException):
+                        self._failed_deliveries += 1
+                        logger.warning("event delivery to subscriber failed: %r", result)
         if self._config.gossip_publish is not None and connection_id != "gossip":
             await self._config.gossip_publish(_serialize_event(event))
 
 
-async def _gather_tasks(tasks: list[object]) -> None:
-    import asyncio
-
-    await asyncio.gather(*tasks)
-
-
 def _serialize_event(event: Mapping[str, object]) -> bytes:
-    import json
-
-    return json.dumps(event, separators=(",", ":"), sort_keys=True, default=_json_default).encode("utf-8")
+    return dumps(event, sort_keys=True, default=_json_default)
 
 
 def _json_default(value: object) -> str:
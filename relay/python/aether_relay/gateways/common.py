@@ -11,10 +11,8 @@ ERROR_SUBSCRIPTION_NOT_FOUND = "subscription_not_found"
 
 
 def from_nostr_event(event: Mapping[str, object]) -> dict[str, object]:
-    translated = dict(event)
-    if "event_id" not in translated and "id" in translated:
-        translated["event_id"] = translated["id"]
-    return _normalize_event(translated)
+    # NIP-01 names the field "id"; read it in place rather than copying the event.
+    return _normalize_event(event, id_field="event_id" if "event_id" in event else "id")
 
 
 def to_nostr_event(event: Mapping[str, object]) -> dict[str, object]:
@@ -55,11 +53,10 @@ def nostr_filter_to_aether(raw: Mapping[str, object]) -> dict[str, object]:
 
     tags: list[tuple[str, str]] = []
     for key, value in raw.items():
-        if not isinstance(key, str) or not key.startswith("#"):
+        # key[:1] beats startswith() on these short keys.
+        if not isinstance(key, str) or key[:1] != "#" or not isinstance(value, list):
             continue
         tag_key = key[1:]
-        if not isinstance(value, list):
-            continue
         for entry in value:
             tags.append((tag_key, str(entry)))
     if tags:
@@ -68,8 +65,8 @@ def nostr_filter_to_aether(raw: Mapping[str, object]) -> dict[str, object]:
     return out
 
 
-def _normalize_event(event: Mapping[str, object]) -> dict[str, object]:
-    event_id = _require_hex(event.get("event_id"), "event_id")
+def _normalize_event(event: Mapping[str, object], *, id_field: str = "event_id") -> dict[str, object]:
+    event_id = _require_hex(event.get(id_field), "event_id")
     pubkey = _require_hex(event.get("pubkey"), "pubkey")
     sig = _require_hex(event.get("sig"), "sig")
     kind = _require_int(event.get("kind"), "kind")
@@ -96,10 +93,11 @@ def _normalize_tags(raw: object) -> list[list[str]]:
         raise ValueError(f"{ERROR_INVALID_EVENT}: tags must be list")
     out: list[list[str]] = []
     for entry in raw:
-        if not isinstance(entry, list) or len(entry) < 1:
-            raise ValueError(f"{ERROR_INVALID_EVENT}: malformed tag")
-        if not all(isinstance(item, str) for item in entry):
+        if not isinstance(entry, list) or not entry:
             raise ValueError(f"{ERROR_INVALID_EVENT}: malformed tag")
+        for item in entry:
+            if not isinstance(item, str):
+                raise ValueError(f"{ERROR_INVALID_EVENT}: malformed tag")
         out.append(entry)
     return out
 
@@ -115,6 +113,8 @@ def _require_hex(value: object, field: str) -> str:
 
 
 def _require_int(value: object, field: str) -> int:
+    if type(value) is int:
+        return value
     if isinstance(value, bool) or value is None:
         raise ValueError(f"{ERROR_INVALID_EVENT}: {field} must be int")
     if isinstance(value, int):
@@ -3,17 +3,18 @@
 from __future__ import annotations
 
 import asyncio
-import json
 from dataclasses import dataclass
 from typing import Any, Mapping
-from urllib.parse import parse_qs, urlparse
+from urllib.parse import parse_qs
 from uuid import uuid4
 
 import websockets
 from websockets.server import WebSocketServer, WebSocketServerProtocol
 
+from .._json import dumps, loads
 from ..core import RelayCore
 from ..handlers import handle_message
+from ..subscriptions import encode_event
 from .common import (
     ERROR_INVALID_EVENT,
     ERROR_INVALID_MESSAGE,
@@ -23,12 +24,17 @@ from .common import (
     to_http_event,
 )
 
+# Idle seconds a persistent connection may wait for its next request.
+KEEP_ALIVE_TIMEOUT = 30.0
+# Most queued SSE frames written per drain() during a burst.
+SSE_BATCH_SIZE = 64
+
 
 @dataclass
 class HttpSubscription:
     connection_id: str
     subscription_id: str
-    queue: asyncio.Queue[dict[str, object]]
+    queue: asyncio.Queue[bytes]
 
 
 class HttpGateway:
@@ -45,50 +51,77 @@ class HttpGateway:
 
     async def _handle_http_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
         try:
-            request_line = await reader.readline()
-            if not request_line:
-                writer.close()
-                await writer.wait_closed()
-                return
-            parts = request_line.decode("utf-8").strip().split(" ")
+            while await self._handle_http_request(reader, writer):
+                pass
+        finally:
+            writer.close()
+            await writer.wait_closed()
+
+    async def _handle_http_request(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> bool:
+        """Serve one request; return True when the connection stays open for another."""
+
+        keep_alive = False
+        try:
+            # Read the request line and headers in one call and split them in
+            # memory, rather than awaiting readline() once per header.
+            try:
+                head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), timeout=KEEP_ALIVE_TIMEOUT)
+            except (asyncio.TimeoutError, asyncio.IncompleteReadError):
+                return False
+            except asyncio.LimitOverrunError:
+                await self._write_json(
+                    writer,
+                    431,
+                    {"error": ERROR_INVALID_MESSAGE, "message": "request head too large"},
+                )
+                return False
+            request_line, _, header_block = head.decode("utf-8").partition("\r\n")
+            parts = request_line.strip().split(" ")
             if len(parts) != 3:
                 await self._write_json(writer, 400, {"error": ERROR_INVALID_MESSAGE, "message": "bad request line"})
-                return
-            method, target, _ = parts
-            headers = await self._read_headers(reader)
+                return False
+            method, target, version = parts
+            headers = _parse_headers(header_block)
+            keep_alive = version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
             body = b""
             if "content-length" in headers:
                 body = await reader.readexactly(int(headers["content-length"]))
 
-            parsed = urlparse(target)
-            if method == "GET" and parsed.path == "/healthz":
-                await self._write_json(writer, 200, {"status": "ok", "dropped_messages": self._dropped_messages})
-                return
-            if method == "POST" and parsed.path == "/v1/events":
-                await self._handle_post_event(writer, body)
-                return
-            if method == "POST" and parsed.path == "/v1/subscriptions":
-                await self._handle_post_subscription(writer, body)
-                return
-            if method == "DELETE" and parsed.path.startswith("/v1/subscriptions/"):
-                sub_id = parsed.path.split("/")[-1]
-                await self._handle_delete_subscription(writer, sub_id)
-                return
-            if method == "GET" and parsed.path == "/v1/stream":
-                query = parse_qs(parsed.query)
-                sub_id = query.get("subscription_id", [None])[0]
+            path, _, query = target.partition("?")
+            if method == "GET" and path == "/healthz":
+                health = {
+                    "status": "ok",
+                    "dropped_messages": self._dropped_messages,
+                    "failed_deliveries": self._core.failed_deliveries,
+                }
+                await self._write_json(writer, 200, health, keep_alive=keep_alive)
+                return keep_alive
+            if method == "POST" and path == "/v1/events":
+                await self._handle_post_event(writer, body, keep_alive=keep_alive)
+                return keep_alive
+            if method == "POST" and path == "/v1/subscriptions":
+                await self._handle_post_subscription(writer, body, keep_alive=keep_alive)
+                return keep_alive
+            if method == "DELETE" and path.startswith("/v1/subscriptions/"):
+                sub_id = path.split("/")[-1]
+                await self._handle_delete_subscription(writer, sub_id, keep_alive=keep_alive)
+                return keep_alive
+            if method == "GET" and path == "/v1/stream":
+                sub_id = parse_qs(query).get("subscription_id", [None])[0]
                 if not isinstance(sub_id, str) or not sub_id:
                     await self._write_json(writer, 400, {"error": ERROR_INVALID_MESSAGE, "message": "subscription_id required"})
-                    return
+                    return False
                 await self._handle_sse_stream(writer, sub_id)
-                return
-            await self._write_json(writer, 404, {"error": "not_found"})
+                return False
+            await self._write_json(writer, 404, {"error": "not_found"}, keep_alive=keep_alive)
+            return keep_alive
         except Exception as exc:
             await self._write_json(writer, 500, {"error": "internal", "message": str(exc)})
+            return False
 
-    async def _handle_post_event(self, writer: asyncio.StreamWriter, body: bytes) -> None:
+    async def _handle_post_event(self, writer: asyncio.StreamWriter, body: bytes, *, keep_alive: bool = False) -> None:
         try:
-            payload = json.loads(body.decode("utf-8") if body else "{}")
+            payload = loads(body or b"{}")
             if not isinstance(payload, Mapping):
                 raise ValueError(f"{ERROR_INVALID_MESSAGE}: payload must be object")
             event = payload.get("event", payload)
@@ -104,17 +137,21 @@ class HttpGateway:
                     "event_id": normalized.get("event_id"),
                     "message": "accepted",
                 },
+                keep_alive=keep_alive,
             )
         except Exception as exc:
             await self._write_json(
                 writer,
                 400,
                 {"accepted": False, "error": ERROR_VALIDATION_FAILED, "message": str(exc)},
+                keep_alive=keep_alive,
             )
 
-    async def _handle_post_subscription(self, writer: asyncio.StreamWriter, body: bytes) -> None:
+    async def _handle_post_subscription(
+        self, writer: asyncio.StreamWriter, body: bytes, *, keep_alive: bool = False
+    ) -> None:
         try:
-            payload = json.loads(body.decode("utf-8") if body else "{}")
+            payload = loads(body or b"{}")
             if not isinstance(payload, Mapping):
                 raise ValueError(f"{ERROR_INVALID_MESSAGE}: payload must be object")
             filters = payload.get("filters")
@@ -136,17 +173,21 @@ class HttpGateway:
                 subscription_id=sub_id,
                 queue=asyncio.Queue(maxsize=1024),
             )
-            await self._write_json(writer, 200, {"subscription_id": sub_id})
+            await self._write_json(writer, 200, {"subscription_id": sub_id}, keep_alive=keep_alive)
         except Exception as exc:
-            await self._write_json(writer, 400, {"error": ERROR_INVALID_MESSAGE, "message": str(exc)})
+            await self._write_json(
+                writer, 400, {"error": ERROR_INVALID_MESSAGE, "message": str(exc)}, keep_alive=keep_alive
+            )
 
-    async def _handle_delete_subscription(self, writer: asyncio.StreamWriter, sub_id: str) -> None:
+    async def _handle_delete_subscription(
+        self, writer: asyncio.StreamWriter, sub_id: str, *, keep_alive: bool = False
+    ) -> None:
         sub = self._subscriptions.pop(sub_id, None)
         if sub is None:
-            await self._write_json(writer, 404, {"error": ERROR_SUBSCRIPTION_NOT_FOUND})
+            await self._write_json(writer, 404, {"error": ERROR_SUBSCRIPTION_NOT_FOUND}, keep_alive=keep_alive)
             return
         self._core.unsubscribe(sub.connection_id, sub.subscription_id)
-        await self._write_json(writer, 200, {"deleted": True, "subscription_id": sub_id})
+        await self._write_json(writer, 200, {"deleted": True, "subscription_id": sub_id}, keep_alive=keep_alive)
 
     async def _handle_sse_stream(self, writer: asyncio.StreamWriter, sub_id: str) -> None:
         sub = self._subscriptions.get(sub_id)
@@ -165,10 +206,15 @@ class HttpGateway:
         try:
             while True:
                 try:
-                    payload = await asyncio.wait_for(sub.queue.get(), timeout=15.0)
+                    data = await asyncio.wait_for(sub.queue.get(), timeout=15.0)
                     event_counter += 1
-                    data = json.dumps(payload, separators=(",", ":"))
-                    writer.write(f"id: {event_counter}\nevent: event\ndata: {data}\n\n".encode("utf-8"))
+                    frames = [b"id: %d\nevent: event\ndata: %s\n\n" % (event_counter, data)]
+                    # Coalesce whatever a fan-out burst already queued into one
+                    # write and one drain.
+                    while len(frames) < SSE_BATCH_SIZE and not sub.queue.empty():
+                        event_counter += 1
+                        frames.append(b"id: %d\nevent: event\ndata: %s\n\n" % (event_counter, sub.queue.get_nowait()))
+                    writer.write(b"".join(frames))
                     await writer.drain()
                 except asyncio.TimeoutError:
                     writer.write(b": heartbeat\n\n")
@@ -191,13 +237,13 @@ class HttpGateway:
         async def send(conn_id: str, payload: Mapping[str, object]) -> None:
             if conn_id != connection_id:
                 return
-            await websocket.send(json.dumps(payload, separators=(",", ":"), default=_json_default))
+            await websocket.send(dumps(payload, default=_json_default).decode())
 
         try:
             async for raw in websocket:
-                message = json.loads(raw)
+                message = loads(raw)
                 if not isinstance(message, Mapping):
-                    await websocket.send(json.dumps({"type": "error", "error": ERROR_INVALID_MESSAGE}))
+                    await websocket.send(dumps({"type": "error", "error": ERROR_INVALID_MESSAGE}).decode())
                     continue
                 if message.get("type") == "publish" and isinstance(message.get("event"), Mapping):
                     try:
@@ -205,7 +251,7 @@ class HttpGateway:
                         await handle_message(self._core, connection_id, {"type": "publish", "event": normalized}, send)
                     except Exception as exc:
                         await websocket.send(
-                            json.dumps({"type": "error", "error": ERROR_VALIDATION_FAILED, "message": str(exc)})
+                            dumps({"type": "error", "error": ERROR_VALIDATION_FAILED, "message": str(exc)}).decode()
                         )
                     continue
                 await handle_message(self._core, connection_id, message, send)
@@ -221,47 +267,59 @@ class HttpGateway:
         if not isinstance(sub_id, str) or not isinstance(event, Mapping):
             return
 
-        for subscription in self._subscriptions.values():
-            if subscription.connection_id == conn_id and subscription.subscription_id == sub_id:
-                message = {"type": "event", "sub_id": sub_id, "event": to_http_event(event)}
-                if subscription.queue.full():
-                    try:
-                        subscription.queue.get_nowait()
-                        self._dropped_messages += 1
-                    except asyncio.QueueEmpty:
-                        pass
-                subscription.queue.put_nowait(message)
-                return
+        subscription = self._subscriptions.get(sub_id)
+        if subscription is not None and subscription.connection_id == conn_id:
+            # Queue the encoded frame; the event body is shared by every subscriber.
+            message = b"".join(
+                (
+                    b'{"type":"event","sub_id":',
+                    dumps(sub_id),
+                    b',"event":',
+                    encode_event(event, _http_event_body),
+                    b"}",
+                )
+            )
+            if subscription.queue.full():
+                try:
+                    subscription.queue.get_nowait()
+                    self._dropped_messages += 1
+                except asyncio.QueueEmpty:
+                    pass
+            subscription.queue.put_nowait(message)
+            return
 
         ws = self._ws_connections.get(conn_id)
         if ws is not None:
-            await ws.send(json.dumps(payload, separators=(",", ":"), default=_json_default))
+            await ws.send(dumps(payload, default=_json_default).decode())
 
-    async def _write_json(self, writer: asyncio.StreamWriter, status: int, payload: Mapping[str, object]) -> None:
-        body = json.dumps(payload, separators=(",", ":"), default=_json_default).encode("utf-8")
+    async def _write_json(
+        self,
+        writer: asyncio.StreamWriter,
+        status: int,
+        payload: Mapping[str, object],
+        *,
+        keep_alive: bool = False,
+    ) -> None:
+        # The connection itself is closed by _handle_http_client.
+        body = dumps(payload, default=_json_default)
         reason = _reason(status)
         response = (
             f"HTTP/1.1 {status} {reason}\r\n"
             "Content-Type: application/json\r\n"
             f"Content-Length: {len(body)}\r\n"
-            "Connection: close\r\n\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
         ).encode("utf-8")
         writer.write(response + body)
         await writer.drain()
-        writer.close()
-        await writer.wait_closed()
-
-    async def _read_headers(self, reader: asyncio.StreamReader) -> dict[str, str]:
-        headers: dict[str, str] = {}
-        while True:
-            line = await reader.readline()
-            if line in (b"\r\n", b"\n", b""):
-                return headers
-            text = line.decode("utf-8").strip()
-            if ":" not in text:
-                continue
-            key, value = text.split(":", 1)
+
+
+def _parse_headers(block: str) -> dict[str, str]:
+    headers: dict[str, str] = {}
+    for line in block.split("\r\n"):
+        key, sep, value = line.partition(":")
+        if sep:
             headers[key.strip().lower()] = value.strip()
+    return headers
 
 
 def _reason(status: int) -> str:
@@ -269,11 +327,16 @@ def _reason(status: int) -> str:
         200: "OK",
         400: "Bad Request",
         404: "Not Found",
+        431: "Request Header Fields Too Large",
         500: "Internal Server Error",
     }
     return mapping.get(status, "OK")
 
 
+def _http_event_body(event: Mapping[str, object]) -> bytes:
+    return dumps(to_http_event(event), default=_json_default)
+
+
 def _json_default(value: object) -> str:
     if isinstance(value, bytes):
         return value.hex()
@@ -2,14 +2,15 @@
 
 from __future__ import annotations
 
-import json
 from typing import Any, Callable, Mapping
 from uuid import uuid4
 
 import websockets
 from websockets.server import WebSocketServer, WebSocketServerProtocol
 
+from .._json import dumps, loads
 from ..core import RelayCore
+from ..subscriptions import encode_event
 from .common import (
     ERROR_INVALID_MESSAGE,
     ERROR_VALIDATION_FAILED,
@@ -34,12 +35,13 @@ async def _handle_nostr(core: RelayCore, websocket: WebSocketServerProtocol) ->
             sub_id = payload.get("sub_id")
             event = payload.get("event")
             if isinstance(sub_id, str) and isinstance(event, Mapping):
-                await websocket.send(json.dumps(["EVENT", sub_id, to_nostr_event(event)]))
+                frame = b'["EVENT",' + dumps(sub_id) + b"," + encode_event(event, _nostr_event_body) + b"]"
+                await websocket.send(frame.decode())
 
     try:
         async for raw in websocket:
             try:
-                message = json.loads(raw)
+                message = loads(raw)
                 if not isinstance(message, list) or not message:
                     await _notice(websocket, f"{ERROR_INVALID_MESSAGE}: expected array message")
                     continue
@@ -79,7 +81,7 @@ async def _on_event(
 
         await core.publish(connection_id, event, send_buffered)
         event_id = str(event.get("event_id", ""))
-        await websocket.send(json.dumps(["OK", event_id, True, "accepted"]))
+        await websocket.send(dumps(["OK", event_id, True, "accepted"]).decode())
         for payload in buffered_events:
             await send(connection_id, payload)
     except Exception as exc:
@@ -88,7 +90,7 @@ async def _on_event(
             raw_id = message[1].get("id") or message[1].get("event_id")
             if isinstance(raw_id, str):
                 event_id = raw_id
-        await websocket.send(json.dumps(["OK", event_id, False, f"{ERROR_VALIDATION_FAILED}: {exc}"]))
+        await websocket.send(dumps(["OK", event_id, False, f"{ERROR_VALIDATION_FAILED}: {exc}"]).decode())
 
 
 async def _on_req(
@@ -108,7 +110,7 @@ async def _on_req(
             raise ValueError(f"{ERROR_INVALID_MESSAGE}: filter must be object")
         filters.append(nostr_filter_to_aether(raw))
     core.subscribe(connection_id, sub_id, filters)
-    await websocket.send(json.dumps(["EOSE", sub_id]))
+    await websocket.send(dumps(["EOSE", sub_id]).decode())
 
 
 async def _on_close(core: RelayCore, connection_id: str, message: list[object]) -> None:
@@ -117,5 +119,9 @@ async def _on_close(core: RelayCore, connection_id: str, message: list[object])
     core.unsubscribe(connection_id, message[1])
 
 
+def _nostr_event_body(event: Mapping[str, object]) -> bytes:
+    return dumps(to_nostr_event(event))
+
+
 async def _notice(websocket: WebSocketServerProtocol, message: str) -> None:
-    await websocket.send(json.dumps(["NOTICE", message]))
+    await websocket.send(dumps(["NOTICE", message]).decode())
@@ -3,36 +3,14 @@
 from __future__ import annotations
 
 import time
-from dataclasses import dataclass
 from typing import Callable, Mapping
 
-from .crypto import normalize_tags
-from .crypto import _serialize_tags  # type: ignore[attr-defined]
-
-
-@dataclass
-class TokenBucket:
-    capacity: int
-    refill_per_second: float
-    tokens: float
-    updated_ns: int
-
-    def refill(self, now_ns: int) -> None:
-        delta = (now_ns - self.updated_ns) / 1_000_000_000
-        if delta <= 0:
-            return
-        self.tokens = min(self.capacity, self.tokens + delta * self.refill_per_second)
-        self.updated_ns = now_ns
-
-    def consume(self, now_ns: int, amount: float = 1.0) -> bool:
-        self.refill(now_ns)
-        if self.tokens < amount:
-            return False
-        self.tokens -= amount
-        return True
+from .crypto import normalize_tags, parse_hex_field, serialized_tags_len
 
 
 class RateLimiter:
+    """Per-pubkey token buckets stored column-wise: pubkey -> slot in parallel lists."""
+
     def __init__(
         self,
         *,
@@ -43,20 +21,30 @@ class RateLimiter:
         self._capacity = capacity
         self._refill_per_second = refill_per_second
         self._now_ns = now_ns
-        self._buckets: dict[bytes, TokenBucket] = {}
+        self._slots: dict[bytes, int] = {}
+        self._tokens: list[float] = []
+        self._updated_ns: list[int] = []
 
     def allow(self, pubkey: bytes) -> bool:
         now = self._now_ns()
-        bucket = self._buckets.get(pubkey)
-        if bucket is None:
-            bucket = TokenBucket(
-                capacity=self._capacity,
-                refill_per_second=self._refill_per_second,
-                tokens=float(self._capacity),
-                updated_ns=now,
-            )
-            self._buckets[pubkey] = bucket
-        return bucket.consume(now)
+        tokens_col = self._tokens
+        updated_col = self._updated_ns
+        slot = self._slots.get(pubkey)
+        if slot is None:
+            slot = self._slots[pubkey] = len(tokens_col)
+            tokens_col.append(float(self._capacity))
+            updated_col.append(now)
+
+        tokens = tokens_col[slot]
+        elapsed_ns = now - updated_col[slot]
+        if elapsed_ns > 0:
+            tokens = min(self._capacity, tokens + elapsed_ns / 1_000_000_000 * self._refill_per_second)
+            updated_col[slot] = now
+        if tokens < 1.0:
+            tokens_col[slot] = tokens
+            return False
+        tokens_col[slot] = tokens - 1.0
+        return True
 
 
 def compute_event_size(event: Mapping[str, object]) -> int:
@@ -73,7 +61,7 @@ def compute_event_size(event: Mapping[str, object]) -> int:
     size += len(pubkey)
     size += 8  # created_at
     size += 2  # kind
-    size += len(_serialize_tags(tags))
+    size += serialized_tags_len(tags)
     size += len(content)
     size += len(sig)
     return size
@@ -85,11 +73,13 @@ def enforce_max_size(event: Mapping[str, object], max_bytes: int) -> None:
 
 
 def _parse_hex_or_bytes(value: object, field: str, size: int) -> bytes:
+    if type(value) is bytes and len(value) == size:
+        return value
     if isinstance(value, bytes):
         data = value
     elif isinstance(value, str):
         try:
-            data = bytes.fromhex(value)
+            data = parse_hex_field(field, value)
         except ValueError as exc:
             raise ValueError(f"{field} must be hex") from exc
     else:
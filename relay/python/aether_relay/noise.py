@@ -18,6 +18,8 @@ from cryptography.hazmat.primitives.asymmetric.x25519 import (
     X25519PublicKey,
 )
 
+_NONCE_PAD = b"\x00\x00\x00\x00"
+
 
 def generate_keypair() -> tuple[bytes, bytes]:
     private_key = X25519PrivateKey.generate()
@@ -46,26 +48,18 @@ class NoiseSession:
     key: bytes
     send_counter: int = 0
 
+    def __post_init__(self) -> None:
+        # Constructing the AEAD schedules the key; do it once per session.
+        self._cipher = ChaCha20Poly1305(self.key)
+
     def encrypt(self, plaintext: bytes) -> bytes:
-        nonce = self._nonce(self.send_counter)
+        prefix = self.send_counter.to_bytes(8, "big")
         self.send_counter += 1
-        cipher = ChaCha20Poly1305(self.key)
-        ciphertext = cipher.encrypt(nonce, plaintext, None)
-        return self._counter_prefix(self.send_counter - 1) + ciphertext
+        return prefix + self._cipher.encrypt(_NONCE_PAD + prefix, plaintext, None)
 
     def decrypt(self, payload: bytes) -> bytes:
         if len(payload) < 8:
             raise ValueError("noise payload too short")
-        counter = int.from_bytes(payload[:8], "big")
-        nonce = self._nonce(counter)
-        cipher = ChaCha20Poly1305(self.key)
-        return cipher.decrypt(nonce, payload[8:], None)
-
-    @staticmethod
-    def _nonce(counter: int) -> bytes:
-        return b"\x00\x00\x00\x00" + counter.to_bytes(8, "big")
-
-    @staticmethod
-    def _counter_prefix(counter: int) -> bytes:
-        return counter.to_bytes(8, "big")
+        # The 8-byte counter prefix is the low part of the 12-byte nonce.
+        return self._cipher.decrypt(_NONCE_PAD + payload[:8], payload[8:], None)
 
@@ -4,22 +4,20 @@ from __future__ import annotations
 
 
 def leading_zero_bits(data: bytes) -> int:
-    count = 0
-    for byte in data:
-        if byte == 0:
-            count += 8
-            continue
-        for bit in range(7, -1, -1):
-            if byte & (1 << bit):
-                return count
-            count += 1
-    return count
+    return len(data) * 8 - int.from_bytes(data, "big").bit_length()
 
 
 def meets_difficulty(event_id: bytes, difficulty: int) -> bool:
     if difficulty <= 0:
         return True
-    return leading_zero_bits(event_id) >= difficulty
+    # Check the required prefix directly instead of counting every zero bit:
+    # `full` whole zero bytes, then the top `partial` bits of the next byte.
+    full, partial = divmod(difficulty, 8)
+    if len(event_id) < full + (partial > 0):
+        return False
+    if event_id.count(0, 0, full) != full:
+        return False
+    return not partial or event_id[full] >> (8 - partial) == 0
 
 
 def validate_pow(event_id: bytes, difficulty: int) -> None:
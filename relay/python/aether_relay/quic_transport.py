@@ -10,39 +10,85 @@ from aioquic.asyncio import QuicConnectionProtocol, serve
 from aioquic.asyncio.server import QuicServer
 from aioquic.quic.configuration import QuicConfiguration
 from aioquic.quic.events import QuicEvent, StreamDataReceived
+from aioquic.quic.packet import QuicErrorCode
 
 from .core import RelayCore
 from .handlers import handle_message
 from .noise import NoiseSession, derive_shared_key, generate_keypair
 from .wire import DecodedMessage, decode_message, encode_message
 
+# Frames parsed but not yet handled, per connection.
+MAX_PENDING_FRAMES = 256
+
 
 class QuicRelayProtocol(QuicConnectionProtocol):
     def __init__(self, *args: Any, core: RelayCore, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
         self._core = core
         self._connection_id = f"quic-{uuid4()}"
-        self._buffers: dict[int, bytearray] = {}
+        self._buffers: dict[int, tuple[bytearray, int]] = {}
         self._format = "json"
         self._handshake_done = False
         self._noise: NoiseSession | None = None
         self._noise_pending: NoiseSession | None = None
+        self._rx: asyncio.Queue[tuple[int, bytes]] = asyncio.Queue(maxsize=MAX_PENDING_FRAMES)
+        self._aborted: set[int] = set()
+        self._worker: asyncio.Task[None] | None = None
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        super().connection_made(transport)
+        self._worker = asyncio.create_task(self._drain())
+
+    def connection_lost(self, exc: Exception | None) -> None:
+        super().connection_lost(exc)
+        if self._worker is not None:
+            self._worker.cancel()
+            self._worker = None
 
     def quic_event_received(self, event: QuicEvent) -> None:
         if isinstance(event, StreamDataReceived):
-            buffer = self._buffers.setdefault(event.stream_id, bytearray())
+            if event.stream_id in self._aborted:
+                return
+            buffer, offset = self._buffers.setdefault(event.stream_id, (bytearray(), 0))
             buffer.extend(event.data)
-            while True:
-                if len(buffer) < 4:
-                    break
-                size = int.from_bytes(buffer[:4], "big")
-                if len(buffer) < 4 + size:
+            end = len(buffer)
+            while end - offset >= 4:
+                size = int.from_bytes(buffer[offset : offset + 4], "big")
+                start = offset + 4
+                if end - start < size:
                     break
-                raw = bytes(buffer[4 : 4 + size])
-                del buffer[: 4 + size]
-                asyncio.create_task(self._handle_message(event.stream_id, raw))
+                try:
+                    self._rx.put_nowait((event.stream_id, bytes(memoryview(buffer)[start : start + size])))
+                except asyncio.QueueFull:
+                    self._abort_stream(event.stream_id)
+                    return
+                offset = start + size
+            # Compact lazily so pipelined frames don't shift the tail once each.
+            if offset * 2 > end:
+                del buffer[:offset]
+                offset = 0
+            self._buffers[event.stream_id] = (buffer, offset)
+
+    def _abort_stream(self, stream_id: int) -> None:
+        # The peer is sending faster than we handle frames: drop the stream
+        # rather than buffering without bound.
+        self._aborted.add(stream_id)
+        self._buffers.pop(stream_id, None)
+        self._quic.reset_stream(stream_id, QuicErrorCode.FLOW_CONTROL_ERROR)
+        self._quic.stop_stream(stream_id, QuicErrorCode.FLOW_CONTROL_ERROR)
+
+    async def _drain(self) -> None:
+        # One consumer per connection keeps frames in arrival order (hello before
+        # anything else) without allocating a task per message.
+        while True:
+            stream_id, raw = await self._rx.get()
+            if stream_id not in self._aborted:
+                await self._handle_message(stream_id, raw)
 
     async def _handle_message(self, stream_id: int, raw: bytes) -> None:
+        # Frames produced while handling one message are queued on the stream and
+        # flushed with a single transmit at the end.
+        send_stream_data = self._quic.send_stream_data
         try:
             decoded = await self._decode_incoming(raw)
 
@@ -50,18 +96,18 @@ class QuicRelayProtocol(QuicConnectionProtocol):
                 data = encode_message(payload, fmt=self._format)  # type: ignore[arg-type]
                 if self._noise is not None:
                     data = self._wrap_noise(data)
-                frame = len(data).to_bytes(4, "big") + data
-                self._quic.send_stream_data(stream_id, frame, end_stream=False)
-                self.transmit()
+                send_stream_data(stream_id, len(data).to_bytes(4, "big") + data, end_stream=False)
 
             if decoded.msg_type == "hello":
                 await self._handle_hello(decoded.payload, send)
             else:
                 await handle_message(self._core, self._connection_id, decoded.payload, send)
         except Exception as exc:
+            if stream_id in self._aborted:
+                return
             data = encode_message({"type": "error", "error": str(exc)}, fmt=self._format)
-            frame = len(data).to_bytes(4, "big") + data
-            self._quic.send_stream_data(stream_id, frame, end_stream=False)
+            send_stream_data(stream_id, len(data).to_bytes(4, "big") + data, end_stream=False)
+        finally:
             self.transmit()
 
     async def _decode_incoming(self, raw: bytes) -> DecodedMessage:
@@ -7,6 +7,7 @@ import asyncio
 import signal
 from pathlib import Path
 
+from ._json import loads
 from .core import RelayCore, RelayConfig
 from .gossip import GossipConfig, GossipMesh
 from .gateways import HttpGateway, serve_nostr
@@ -161,7 +162,12 @@ def main() -> None:
     parser.add_argument("--http-ws-port", type=int, default=8082)
 
     args = parser.parse_args()
-    asyncio.run(_run(args))
+    try:
+        import uvloop
+    except ImportError:  # pragma: no cover - optional dependency
+        asyncio.run(_run(args))
+    else:
+        uvloop.run(_run(args))
 
 
 async def _noop_send(_conn_id: str, _message: dict[str, object]) -> None:
@@ -169,9 +175,7 @@ async def _noop_send(_conn_id: str, _message: dict[str, object]) -> None:
 
 
 def _decode_gossip(data: bytes) -> dict[str, object]:
-    import json
-
-    return json.loads(data.decode("utf-8"))
+    return loads(data)
 
 
 def _build_store(storage: str, storage_path: str, *, retention_ns: int | None) -> object:
@@ -3,19 +3,26 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+import heapq
+from itertools import chain
 import time
-from typing import Callable, Iterable, Mapping, Sequence
+from typing import AbstractSet, Callable, Iterable, Mapping, Sequence
 
 from ..bloom import BloomFilter
-from ..crypto import Tag, normalize_tags
+from ..crypto import Tag, normalize_tags, parse_hex_field
 
 IMMUTABLE_RANGE = range(0, 1000)
 REPLACEABLE_RANGE = range(10_000, 20_000)
 EPHEMERAL_RANGE = range(20_000, 30_000)
 PARAMETERIZED_RANGE = range(30_000, 40_000)
 
+_EMPTY_IDS: frozenset[bytes] = frozenset()
+# Candidate sets covering more than 1/_DENSE_CANDIDATES of the store are
+# resolved by a scan in insertion order rather than per-id lookups.
+_DENSE_CANDIDATES = 2
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class StoredEvent:
     event: dict[str, object]
     event_id: bytes
@@ -40,57 +47,78 @@ class InMemoryEventStore:
         self._by_id: dict[bytes, StoredEvent] = {}
         self._index_pubkey: dict[bytes, set[bytes]] = {}
         self._index_kind: dict[int, set[bytes]] = {}
-        self._index_tag: dict[tuple[str, str], set[bytes]] = {}
+        # Most tag values name a single event, so a bucket holds the bare
+        # event_id until a second event shares it.
+        self._index_tag: dict[tuple[str, str], bytes | set[bytes]] = {}
+        # One bytes object per stored author, shared by all of their events.
+        self._pubkeys: dict[bytes, bytes] = {}
+        # (created_at, event_id) for immutable events, oldest first, so the
+        # retention sweep only touches what it evicts.
+        self._by_time: list[tuple[int, bytes]] = []
         self._retention_ns = retention_ns
         self._now_ns = now_ns
         self._bloom = bloom
+        # kind // 10_000 selects the range; the immutable bucket also holds the
+        # unsupported 1000..9999 kinds, which its handler rejects.
+        self._insert_by_bucket: dict[int, Callable[[StoredEvent], bool]] = {
+            0: self._insert_immutable,
+            1: self._insert_replaceable,
+            2: self._insert_ephemeral,
+            3: self._insert_parameterized,
+        }
 
     def insert(self, event: Mapping[str, object]) -> bool:
-        stored = _normalize_event(event)
-        kind = stored.kind
+        stored = _normalize_event(event, self._pubkeys)
+        handler = self._insert_by_bucket.get(stored.kind // 10_000)
+        if handler is None:
+            raise ValueError("kind out of supported range")
+        return handler(stored)
+
+    def _insert_immutable(self, stored: StoredEvent) -> bool:
+        if stored.kind not in IMMUTABLE_RANGE:
+            raise ValueError("kind out of supported range")
+        if self._is_duplicate(stored):
+            return False
+        self._prune_expired()
+        if self._is_expired(stored):
+            return False
+        if stored.event_id in self._immutable:
+            return False
+        self._immutable[stored.event_id] = stored
+        if self._retention_ns is not None:
+            heapq.heappush(self._by_time, (stored.created_at, stored.event_id))
+        self._add_indexes(stored)
+        if self._bloom:
+            self._bloom.add(stored.event_id)
+        return True
 
-        if kind in EPHEMERAL_RANGE:
+    def _insert_replaceable(self, stored: StoredEvent) -> bool:
+        if self._is_duplicate(stored):
             return False
-        if self._bloom and self._bloom.might_contain(stored.event_id):
-            if stored.event_id in self._by_id:
-                return False
-        if kind in IMMUTABLE_RANGE:
-            self._prune_expired()
-            if self._is_expired(stored):
-                return False
-            if stored.event_id in self._immutable:
-                return False
-            self._immutable[stored.event_id] = stored
-            self._add_indexes(stored)
-            if self._bloom:
-                self._bloom.add(stored.event_id)
-            return True
-        if kind in REPLACEABLE_RANGE:
-            replaceable_key = (stored.pubkey, stored.kind)
-            existing = self._replaceable.get(replaceable_key)
-            if existing and stored.created_at <= existing.created_at:
-                return False
-            if existing:
-                self._remove_indexes(existing)
-            self._replaceable[replaceable_key] = stored
-            self._add_indexes(stored)
-            if self._bloom:
-                self._bloom.add(stored.event_id)
-            return True
-        if kind in PARAMETERIZED_RANGE:
-            parameterized_key = (stored.pubkey, stored.kind, stored.d_tag)
-            existing = self._parameterized.get(parameterized_key)
-            if existing and stored.created_at <= existing.created_at:
-                return False
-            if existing:
-                self._remove_indexes(existing)
-            self._parameterized[parameterized_key] = stored
-            self._add_indexes(stored)
-            if self._bloom:
-                self._bloom.add(stored.event_id)
-            return True
-
-        raise ValueError("kind out of supported range")
+        return self._replace(self._replaceable, (stored.pubkey, stored.kind), stored)
+
+    def _insert_ephemeral(self, stored: StoredEvent) -> bool:
+        return False
+
+    def _insert_parameterized(self, stored: StoredEvent) -> bool:
+        if self._is_duplicate(stored):
+            return False
+        return self._replace(self._parameterized, (stored.pubkey, stored.kind, stored.d_tag), stored)
+
+    def _replace(self, slots: dict, key: tuple, stored: StoredEvent) -> bool:
+        existing = slots.get(key)
+        if existing and stored.created_at <= existing.created_at:
+            return False
+        if existing:
+            self._remove_indexes(existing)
+        slots[key] = stored
+        self._add_indexes(stored)
+        if self._bloom:
+            self._bloom.add(stored.event_id)
+        return True
+
+    def _is_duplicate(self, stored: StoredEvent) -> bool:
+        return bool(self._bloom and self._bloom.might_contain(stored.event_id) and stored.event_id in self._by_id)
 
     def query(
         self,
@@ -109,27 +137,26 @@ class InMemoryEventStore:
             else None
         )
         tag_set = set(tags) if tags is not None else None
+        if (kind_set is not None and not kind_set) or (pubkey_set is not None and not pubkey_set):
+            return []
 
+        # Candidates already satisfy the kind/pubkey/tag constraints exactly.
         event_ids = self._candidate_ids(kind_set, pubkey_set, tag_set)
-        events = [self._by_id[event_id] for event_id in event_ids] if event_ids is not None else [
-            *self._immutable.values(),
-            *self._replaceable.values(),
-            *self._parameterized.values(),
-        ]
-        result: list[Mapping[str, object]] = []
-        for stored in events:
-            if kind_set is not None and stored.kind not in kind_set:
-                continue
-            if pubkey_set is not None and stored.pubkey not in pubkey_set:
-                continue
-            if tag_set is not None and not _event_has_tags(stored.tags, tag_set):
-                continue
-            if since is not None and stored.created_at < since:
-                continue
-            if until is not None and stored.created_at > until:
-                continue
-            result.append(stored.event)
-        return result
+        if event_ids is not None and len(event_ids) * _DENSE_CANDIDATES > len(self._by_id):
+            # Most events match: walking the store sequentially and testing
+            # membership beats hopping between scattered events by id.
+            events: Iterable[StoredEvent] = filter(lambda stored: stored.event_id in event_ids, self._by_id.values())
+        elif event_ids is not None:
+            events = map(self._by_id.__getitem__, event_ids)
+        else:
+            events = chain(self._immutable.values(), self._replaceable.values(), self._parameterized.values())
+        if since is None and until is None:
+            return [stored.event for stored in events]
+        if until is None:
+            return [stored.event for stored in events if stored.created_at >= since]
+        if since is None:
+            return [stored.event for stored in events if stored.created_at <= until]
+        return [stored.event for stored in events if since <= stored.created_at <= until]
 
     def _is_expired(self, stored: StoredEvent) -> bool:
         if self._retention_ns is None:
@@ -139,8 +166,10 @@ class InMemoryEventStore:
     def _prune_expired(self) -> None:
         if self._retention_ns is None:
             return
-        expired = [event_id for event_id, stored in self._immutable.items() if self._is_expired(stored)]
-        for event_id in expired:
+        cutoff = self._now_ns() - self._retention_ns
+        by_time = self._by_time
+        while by_time and by_time[0][0] < cutoff:
+            _, event_id = heapq.heappop(by_time)
             stored = self._immutable.pop(event_id, None)
             if stored:
                 self._remove_indexes(stored)
@@ -150,40 +179,39 @@ class InMemoryEventStore:
         kind_set: set[int] | None,
         pubkey_set: set[bytes] | None,
         tag_set: set[tuple[str, str]] | None,
-    ) -> set[bytes] | None:
-        candidates: set[bytes] | None = None
+    ) -> AbstractSet[bytes] | None:
+        # Tag buckets are single lookups; resolve them first so an unknown tag
+        # short-circuits before any kind/pubkey unions are built.
+        groups: list[AbstractSet[bytes]] = [_posting_ids(self._index_tag.get(tag)) for tag in tag_set or ()]
+        if not all(groups):
+            return _EMPTY_IDS
         if kind_set:
-            candidates = set()
-            for kind in kind_set:
-                candidates |= self._index_kind.get(kind, set())
+            groups.append(_union_index(self._index_kind, kind_set))
         if pubkey_set:
-            pubkey_ids: set[bytes] = set()
-            for pubkey in pubkey_set:
-                pubkey_ids |= self._index_pubkey.get(pubkey, set())
-            candidates = pubkey_ids if candidates is None else candidates & pubkey_ids
-        if tag_set:
-            tag_ids: set[bytes] | None = None
-            for tag in tag_set:
-                ids = self._index_tag.get(tag, set())
-                tag_ids = ids if tag_ids is None else tag_ids & ids
-            candidates = tag_ids if candidates is None else candidates & (tag_ids or set())
-        return candidates
+            groups.append(_union_index(self._index_pubkey, pubkey_set))
+        if not groups:
+            return None
+        groups.sort(key=len)
+        return groups[0].intersection(*groups[1:])
 
     def _add_indexes(self, stored: StoredEvent) -> None:
         self._by_id[stored.event_id] = stored
+        self._pubkeys.setdefault(stored.pubkey, stored.pubkey)
         self._index_pubkey.setdefault(stored.pubkey, set()).add(stored.event_id)
         self._index_kind.setdefault(stored.kind, set()).add(stored.event_id)
         for tag in stored.tags:
             for value in tag.values:
-                self._index_tag.setdefault((tag.key, value), set()).add(stored.event_id)
+                _add_posting(self._index_tag, (tag.key, value), stored.event_id)
 
     def _remove_indexes(self, stored: StoredEvent) -> None:
         self._by_id.pop(stored.event_id, None)
         self._discard_index(self._index_pubkey, stored.pubkey, stored.event_id)
+        if stored.pubkey not in self._index_pubkey:
+            self._pubkeys.pop(stored.pubkey, None)
         self._discard_index(self._index_kind, stored.kind, stored.event_id)
         for tag in stored.tags:
             for value in tag.values:
-                self._discard_index(self._index_tag, (tag.key, value), stored.event_id)
+                _discard_posting(self._index_tag, (tag.key, value), stored.event_id)
 
     @staticmethod
     def _discard_index(
@@ -199,9 +227,49 @@ class InMemoryEventStore:
             index.pop(key, None)
 
 
-def _normalize_event(event: Mapping[str, object]) -> StoredEvent:
+def _add_posting(index: dict[tuple[str, str], bytes | set[bytes]], key: tuple[str, str], event_id: bytes) -> None:
+    bucket = index.get(key)
+    if bucket is None:
+        index[key] = event_id
+    elif type(bucket) is bytes:
+        if bucket != event_id:
+            index[key] = {bucket, event_id}
+    else:
+        bucket.add(event_id)  # type: ignore[union-attr]
+
+
+def _discard_posting(index: dict[tuple[str, str], bytes | set[bytes]], key: tuple[str, str], event_id: bytes) -> None:
+    bucket = index.get(key)
+    if bucket is None:
+        return
+    if type(bucket) is bytes:
+        if bucket == event_id:
+            del index[key]
+        return
+    bucket.discard(event_id)  # type: ignore[union-attr]
+    if len(bucket) == 1:
+        index[key] = next(iter(bucket))
+
+
+def _posting_ids(bucket: bytes | set[bytes] | None) -> AbstractSet[bytes]:
+    if bucket is None:
+        return _EMPTY_IDS
+    if type(bucket) is bytes:
+        return frozenset((bucket,))
+    return bucket  # type: ignore[return-value]
+
+
+def _union_index(index: Mapping[object, set[bytes]], keys: set) -> AbstractSet[bytes]:
+    if len(keys) == 1:
+        return index.get(next(iter(keys)), _EMPTY_IDS)
+    return set().union(*(index.get(key, _EMPTY_IDS) for key in keys))
+
+
+def _normalize_event(event: Mapping[str, object], pubkeys: Mapping[bytes, bytes] | None = None) -> StoredEvent:
     event_id = _parse_hex_or_bytes(event.get("event_id"), "event_id", 32)
     pubkey = _parse_hex_or_bytes(event.get("pubkey"), "pubkey", 32)
+    if pubkeys is not None:
+        pubkey = pubkeys.get(pubkey, pubkey)
     kind = _parse_int(event.get("kind"), "kind")
     created_at = _parse_int(event.get("created_at"), "created_at")
     tags = normalize_tags(_parse_tags(event.get("tags")))
@@ -232,19 +300,14 @@ def _extract_d_tag(tags: Sequence[Tag]) -> str:
     return ""
 
 
-def _event_has_tags(tags: Sequence[Tag], required: set[tuple[str, str]]) -> bool:
-    if not required:
-        return True
-    available = {(tag.key, value) for tag in tags for value in tag.values}
-    return required.issubset(available)
-
-
 def _parse_hex_or_bytes(value: object, field: str, size: int) -> bytes:
+    if type(value) is bytes and len(value) == size:
+        return value
     if isinstance(value, bytes):
         data = value
     elif isinstance(value, str):
         try:
-            data = bytes.fromhex(value)
+            data = parse_hex_field(field, value)
         except ValueError as exc:
             raise ValueError(f"{field} must be hex") from exc
     else:
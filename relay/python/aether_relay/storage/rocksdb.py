@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
-import json
+import struct
 from typing import Iterable, Mapping
 
-from ..crypto import normalize_tags
+from .._json import dumps, loads
+from ..crypto import Tag, normalize_tags
 from .memory import (
     EPHEMERAL_RANGE,
     IMMUTABLE_RANGE,
@@ -17,6 +18,24 @@ from .memory import (
     _parse_tags,
 )
 
+# version, event_id, pubkey, sig, kind, created_at, len(d_tag), len(tags JSON);
+# followed by d_tag, tags JSON and the raw content.
+_RECORD_HEADER = struct.Struct(">B32s32s64sIQHI")
+_RECORD_VERSION = 1
+# kind and created_at sit after version, event_id, pubkey and sig.
+_RECORD_SUMMARY = struct.Struct(">129xIQ")
+_PUBKEY_OFFSET = 33
+
+# Fixed-layout index keys, packed in one allocation.
+_REPLACEABLE_KEY = struct.Struct(">2s32sH")
+_KIND_INDEX_KEY = struct.Struct(">2sHQ32s")
+_PUBKEY_INDEX_KEY = struct.Struct(">3s32sQ32s")
+_TIME_INDEX_KEY = struct.Struct(">3sQ32s")
+
+# Marks a database whose k:/pk:/ts: time indexes cover every stored event.
+_INDEX_VERSION_KEY = b"meta:time-index"
+_INDEX_VERSION = b"2"
+
 
 class RocksDBEventStore:
     def __init__(self, path: str, *, retention_ns: int | None = None) -> None:
@@ -28,6 +47,8 @@ class RocksDBEventStore:
         self._rocksdb = rocksdb
         self._db = rocksdb.DB(path, rocksdb.Options(create_if_missing=True))
         self._retention_ns = retention_ns
+        if self._db.get(_INDEX_VERSION_KEY) != _INDEX_VERSION:
+            self._build_time_indexes()
 
     def insert(self, event: Mapping[str, object]) -> bool:
         normalized = _normalize_event(event)
@@ -65,7 +86,6 @@ class RocksDBEventStore:
         since: int | None = None,
         until: int | None = None,
     ) -> list[Mapping[str, object]]:
-        events = [self._decode_event(value) for _key, value in self._db.iterator(prefix=b"e:")]
         kind_set = set(kinds) if kinds is not None else None
         pubkey_set = (
             {_parse_hex_or_bytes(value, "pubkey", 32) for value in pubkeys}
@@ -74,25 +94,102 @@ class RocksDBEventStore:
         )
         tag_set = set(tags) if tags is not None else None
 
+        ambiguous_tags = bool(tag_set) and any(":" in key or ":" in value for key, value in tag_set)
+        event_ids = self._candidate_ids(kind_set, pubkey_set, tag_set, since, until)
+        if event_ids is None:
+            values = (value for _key, value in self._db.iterator(prefix=b"e:"))
+        else:
+            # Fetch in event_id order, the order a full e: scan returns, so the
+            # result does not depend on set iteration order.
+            keys = [b"e:" + event_id for event_id in sorted(event_ids)]
+            found = self._db.multi_get(keys)
+            values = (found.get(key) for key in keys)
+
         result: list[Mapping[str, object]] = []
-        for event in events:
-            if kind_set is not None and event["kind"] not in kind_set:
+        for value in values:
+            if value is None:
+                continue
+            # Filter on the fixed header fields before decoding tags and content.
+            kind, pubkey, created_at = _record_summary(value)
+            if kind_set is not None and kind not in kind_set:
                 continue
-            if pubkey_set is not None and event["pubkey"] not in pubkey_set:
+            if pubkey_set is not None and pubkey not in pubkey_set:
                 continue
-            if since is not None and event["created_at"] < since:
+            if since is not None and created_at < since:
                 continue
-            if until is not None and event["created_at"] > until:
+            if until is not None and created_at > until:
                 continue
-            if tag_set is not None and not _event_has_tags(event, tag_set):
+            event = self._decode_event(value)
+            if ambiguous_tags and not _event_has_tags(event, tag_set):
                 continue
             result.append(event)
         return result
 
+    def _candidate_ids(
+        self,
+        kind_set: set[int] | None,
+        pubkey_set: set[bytes] | None,
+        tag_set: set[tuple[str, str]] | None,
+        since: int | None,
+        until: int | None,
+    ) -> set[bytes] | None:
+        # Kind/pubkey/time are re-checked on the decoded events; tag hits are exact
+        # unless a ':' makes the t: key ambiguous (see query).
+        groups: list[set[bytes]] = []
+        if kind_set is not None:
+            kind_ids: set[bytes] = set()
+            # Kinds outside uint16 have no k: key and cannot match a stored event.
+            for kind in kind_set:
+                if not isinstance(kind, int) or not 0 <= kind <= 0xFFFF:
+                    continue
+                kind_ids |= self._scan_time_index(_kind_index_prefix(kind), since, until)
+            groups.append(kind_ids)
+        if pubkey_set is not None:
+            pubkey_ids: set[bytes] = set()
+            for pubkey in pubkey_set:
+                pubkey_ids |= self._scan_time_index(_pubkey_index_prefix(pubkey), since, until)
+            groups.append(pubkey_ids)
+        for tag_key, tag_value in tag_set or ():
+            prefix = _tag_index_prefix(tag_key, tag_value)
+            size = len(prefix) + 32
+            # Skip longer keys whose value merely starts with this one (e.g. "a" vs "a:b").
+            groups.append({key[-32:] for key, _value in self._db.iterator(prefix=prefix) if len(key) == size})
+        if not groups:
+            if since is None and until is None:
+                return None
+            return self._scan_time_index(b"ts:", since, until)
+        groups.sort(key=len)
+        return groups[0].intersection(*groups[1:])
+
+    def _scan_time_index(self, prefix: bytes, since: int | None, until: int | None) -> set[bytes]:
+        ids: set[bytes] = set()
+        offset = len(prefix)
+        for key, _value in self._db.iterator(prefix=prefix):
+            created_at = int.from_bytes(key[offset : offset + 8], "big")
+            if until is not None and created_at > until:
+                break
+            if since is not None and created_at < since:
+                continue
+            ids.add(key[-32:])
+        return ids
+
+    def _build_time_indexes(self) -> None:
+        batch = self._rocksdb.WriteBatch()
+        for _key, value in self._db.iterator(prefix=b"e:"):
+            event = self._decode_event(value)
+            batch.put(_kind_index_key(event["kind"], event["created_at"], event["event_id"]), b"")
+            batch.put(_pubkey_index_key(event["pubkey"], event["created_at"], event["event_id"]), b"")
+            batch.put(_time_index_key(event["created_at"], event["event_id"]), b"")
+        batch.put(_INDEX_VERSION_KEY, _INDEX_VERSION)
+        self._db.write(batch)
+
     def _write_event(self, event: _StoredEvent) -> None:
         batch = self._rocksdb.WriteBatch()
         batch.put(b"e:" + event.event_id, _encode_event(event))
         batch.put(_replaceable_key(event.pubkey, event.kind), event.event_id)
+        batch.put(_kind_index_key(event.kind, event.created_at, event.event_id), b"")
+        batch.put(_pubkey_index_key(event.pubkey, event.created_at, event.event_id), b"")
+        batch.put(_time_index_key(event.created_at, event.event_id), b"")
         if event.d_tag:
             batch.put(_parameterized_key(event.pubkey, event.kind, event.d_tag), event.event_id)
         for tag in event.tags:
@@ -108,6 +205,9 @@ class RocksDBEventStore:
         batch = self._rocksdb.WriteBatch()
         batch.delete(b"e:" + event_id)
         batch.delete(_replaceable_key(event["pubkey"], event["kind"]))
+        batch.delete(_kind_index_key(event["kind"], event["created_at"], event_id))
+        batch.delete(_pubkey_index_key(event["pubkey"], event["created_at"], event_id))
+        batch.delete(_time_index_key(event["created_at"], event_id))
         if event.get("d_tag"):
             batch.delete(_parameterized_key(event["pubkey"], event["kind"], event["d_tag"]))
         for tag in normalize_tags(_parse_tags(event.get("tags"))):
@@ -146,7 +246,8 @@ class _StoredEvent:
         kind: int,
         created_at: int,
         d_tag: str,
-        tags: list[object],
+        tags: list[Tag],
+        raw_tags: list[object],
         content: bytes,
         sig: bytes,
     ) -> None:
@@ -155,8 +256,8 @@ class _StoredEvent:
         self.kind = kind
         self.created_at = created_at
         self.d_tag = d_tag
-        self.tags = normalize_tags(tags)
-        self.raw_tags = tags
+        self.tags = tags
+        self.raw_tags = raw_tags
         self.content = content
         self.sig = sig
 
@@ -166,8 +267,11 @@ def _normalize_event(event: Mapping[str, object]) -> _StoredEvent:
     pubkey = _parse_hex_or_bytes(event.get("pubkey"), "pubkey", 32)
     kind = _parse_int(event.get("kind"), "kind")
     created_at = _parse_int(event.get("created_at"), "created_at")
-    tags = _parse_tags(event.get("tags"))
-    d_tag = _extract_d_tag(normalize_tags(tags))
+    if not 0 <= created_at <= 0xFFFFFFFFFFFFFFFF:
+        raise ValueError("created_at must be uint64")
+    raw_tags = _parse_tags(event.get("tags"))
+    tags = normalize_tags(raw_tags)
+    d_tag = _extract_d_tag(tags)
     content = _parse_content(event.get("content"))
     sig = _parse_hex_or_bytes(event.get("sig"), "sig", 64)
 
@@ -178,27 +282,67 @@ def _normalize_event(event: Mapping[str, object]) -> _StoredEvent:
         created_at=created_at,
         d_tag=d_tag,
         tags=tags,
+        raw_tags=raw_tags,
         content=content,
         sig=sig,
     )
 
 
 def _encode_event(event: _StoredEvent) -> bytes:
-    payload = {
-        "event_id": event.event_id.hex(),
-        "pubkey": event.pubkey.hex(),
-        "kind": event.kind,
-        "created_at": event.created_at,
-        "d_tag": event.d_tag,
-        "tags": event.raw_tags,
-        "content": event.content.hex(),
-        "sig": event.sig.hex(),
-    }
-    return json.dumps(payload, separators=(",", ":"), sort_keys=True).encode("utf-8")
+    d_tag = event.d_tag.encode("utf-8")
+    tags = dumps(event.raw_tags)
+    return b"".join(
+        (
+            _RECORD_HEADER.pack(
+                _RECORD_VERSION,
+                event.event_id,
+                event.pubkey,
+                event.sig,
+                event.kind,
+                event.created_at,
+                len(d_tag),
+                len(tags),
+            ),
+            d_tag,
+            tags,
+            event.content,
+        )
+    )
 
 
 def _decode_event(value: bytes) -> Mapping[str, object]:
-    payload = json.loads(value.decode("utf-8"))
+    if value[:1] == b"{":
+        return _decode_json_event(value)
+    _version, event_id, pubkey, sig, kind, created_at, d_tag_len, tags_len = _RECORD_HEADER.unpack_from(value)
+    offset = _RECORD_HEADER.size
+    d_tag = value[offset : offset + d_tag_len].decode("utf-8")
+    offset += d_tag_len
+    tags = loads(value[offset : offset + tags_len])
+    return {
+        "event_id": event_id,
+        "pubkey": pubkey,
+        "kind": kind,
+        "created_at": created_at,
+        "d_tag": d_tag,
+        "tags": tags,
+        "content": value[offset + tags_len :],
+        "sig": sig,
+    }
+
+
+def _record_summary(value: bytes) -> tuple[int, bytes, int]:
+    """Return (kind, pubkey, created_at) without decoding the whole record."""
+
+    if value[:1] == b"{":
+        event = _decode_json_event(value)
+        return event["kind"], event["pubkey"], event["created_at"]  # type: ignore[return-value]
+    kind, created_at = _RECORD_SUMMARY.unpack_from(value)
+    return kind, value[_PUBKEY_OFFSET : _PUBKEY_OFFSET + 32], created_at
+
+
+def _decode_json_event(value: bytes) -> Mapping[str, object]:
+    # Records written before the binary layout.
+    payload = loads(value)
     return {
         "event_id": bytes.fromhex(payload["event_id"]),
         "pubkey": bytes.fromhex(payload["pubkey"]),
@@ -218,15 +362,39 @@ def _event_has_tags(event: Mapping[str, object], required: set[tuple[str, str]])
 
 
 def _replaceable_key(pubkey: bytes, kind: int) -> bytes:
-    return b"r:" + pubkey + kind.to_bytes(2, "big")
+    return _REPLACEABLE_KEY.pack(b"r:", pubkey, kind)
 
 
 def _parameterized_key(pubkey: bytes, kind: int, d_tag: str) -> bytes:
-    return b"p:" + pubkey + kind.to_bytes(2, "big") + d_tag.encode("utf-8")
+    return _REPLACEABLE_KEY.pack(b"p:", pubkey, kind) + d_tag.encode("utf-8")
+
+
+def _tag_index_prefix(tag_key: str, tag_value: str) -> bytes:
+    return b"".join((b"t:", tag_key.encode("utf-8"), b":", tag_value.encode("utf-8"), b":"))
 
 
 def _tag_index_key(tag_key: str, tag_value: str, event_id: bytes) -> bytes:
-    return b"t:" + tag_key.encode("utf-8") + b":" + tag_value.encode("utf-8") + b":" + event_id
+    return b"".join((b"t:", tag_key.encode("utf-8"), b":", tag_value.encode("utf-8"), b":", event_id))
+
+
+def _time_index_key(created_at: int, event_id: bytes) -> bytes:
+    return _TIME_INDEX_KEY.pack(b"ts:", created_at, event_id)
+
+
+def _kind_index_prefix(kind: int) -> bytes:
+    return b"k:" + kind.to_bytes(2, "big")
+
+
+def _kind_index_key(kind: int, created_at: int, event_id: bytes) -> bytes:
+    return _KIND_INDEX_KEY.pack(b"k:", kind, created_at, event_id)
+
+
+def _pubkey_index_prefix(pubkey: bytes) -> bytes:
+    return b"pk:" + pubkey
+
+
+def _pubkey_index_key(pubkey: bytes, created_at: int, event_id: bytes) -> bytes:
+    return _PUBKEY_INDEX_KEY.pack(b"pk:", pubkey, created_at, event_id)
 
 
 def _parse_content(value: object) -> bytes:
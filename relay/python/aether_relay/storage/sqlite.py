@@ -69,20 +69,16 @@ class SQLiteEventStore:
         if until is not None:
             where.append("created_at <= ?")
             params.append(until)
+        for tag_key, tag_value in set(tags) if tags is not None else ():
+            where.append("event_id IN (SELECT event_id FROM event_tags WHERE tag_key = ? AND tag_value = ?)")
+            params.extend((tag_key, tag_value))
 
         base_query = "SELECT event_id, pubkey, kind, created_at, tags, content, sig FROM events"
         if where:
             base_query += " WHERE " + " AND ".join(where)
 
         rows = self._conn.execute(base_query, params).fetchall()
-        events = [_row_to_event(row) for row in rows]
-        if tags is None:
-            return events
-
-        tag_set = set(tags)
-        if not tag_set:
-            return events
-        return [event for event in events if _event_has_tags(event, tag_set)]
+        return [_row_to_event(row) for row in rows]
 
     def _prune_if_needed(self) -> None:
         if self._retention_ns is None:
@@ -112,7 +108,9 @@ class SQLiteEventStore:
                 content BLOB NOT NULL,
                 sig BLOB NOT NULL
             );
-            CREATE INDEX IF NOT EXISTS events_pubkey_idx ON events(pubkey);
+            -- Serves replaceable/parameterized lookups and, by prefix, pubkey filters.
+            DROP INDEX IF EXISTS events_pubkey_idx;
+            CREATE INDEX IF NOT EXISTS events_pubkey_kind_d_tag_idx ON events(pubkey, kind, d_tag);
             CREATE INDEX IF NOT EXISTS events_kind_idx ON events(kind);
 
             CREATE TABLE IF NOT EXISTS event_tags (
@@ -252,12 +250,6 @@ def _row_to_event(row: tuple[object, ...]) -> dict[str, object]:
     }
 
 
-def _event_has_tags(event: Mapping[str, object], required: set[tuple[str, str]]) -> bool:
-    tags = normalize_tags(_parse_tags(event.get("tags")))
-    available = {(tag.key, value) for tag in tags for value in tag.values}
-    return required.issubset(available)
-
-
 def _parse_content(value: object) -> bytes:
     if value is None:
         return b""
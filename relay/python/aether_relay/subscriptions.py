@@ -11,6 +11,32 @@ from .filters import EventFilter, match_event
 SendFn = Callable[[str, str, Mapping[str, object]], Awaitable[None]]
 
 
+class FanoutEvent(dict[str, object]):
+    """Snapshot of one published event, shared by every matching subscription.
+
+    Transports encode through encode_event() so each output format is built
+    once per publish rather than once per subscriber.
+    """
+
+    __slots__ = ("_encoded",)
+
+    def __init__(self, event: Mapping[str, object]) -> None:
+        super().__init__(event)
+        self._encoded: dict[Callable[[Mapping[str, object]], bytes], bytes] = {}
+
+    def encode_once(self, encoder: Callable[[Mapping[str, object]], bytes]) -> bytes:
+        body = self._encoded.get(encoder)
+        if body is None:
+            body = self._encoded[encoder] = encoder(self)
+        return body
+
+
+def encode_event(event: Mapping[str, object], encoder: Callable[[Mapping[str, object]], bytes]) -> bytes:
+    if isinstance(event, FanoutEvent):
+        return event.encode_once(encoder)
+    return encoder(event)
+
+
 @dataclass(frozen=True)
 class Subscription:
     connection_id: str
@@ -51,10 +77,16 @@ class SubscriptionManager:
 
     def dispatch(self, event: Mapping[str, object], send: SendFn) -> list[asyncio.Task[None]]:
         tasks: list[asyncio.Task[None]] = []
-        for subscription in self.matches(event):
+        matches = self.matches(event)
+        if not matches:
+            return tasks
+        # One snapshot per publish: later changes to the caller's dict cannot
+        # leak into queued deliveries, and encodings are shared between them.
+        shared = FanoutEvent(event)
+        for subscription in matches:
             tasks.append(
                 asyncio.create_task(
-                    send(subscription.connection_id, subscription.subscription_id, event)
+                    send(subscription.connection_id, subscription.subscription_id, shared)
                 )
             )
         return tasks
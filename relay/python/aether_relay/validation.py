@@ -5,7 +5,7 @@ from __future__ import annotations
 import time
 from typing import Mapping
 
-from .crypto import compute_event_id, normalize_tags, verify
+from .crypto import compute_event_id, normalize_tags, parse_hex_field, verify
 from .limits import RateLimiter, enforce_max_size
 from .pow import validate_pow
 
@@ -59,11 +59,13 @@ def validate_event(
 
 
 def _parse_hex_or_bytes(value: object, field: str, size: int) -> bytes:
+    if type(value) is bytes and len(value) == size:
+        return value
     if isinstance(value, bytes):
         data = value
     elif isinstance(value, str):
         try:
-            data = bytes.fromhex(value)
+            data = parse_hex_field(field, value)
         except ValueError as exc:
             raise ValueError(f"{field} must be hex") from exc
     else:
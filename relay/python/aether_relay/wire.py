@@ -8,6 +8,9 @@ from typing import Any, Literal
 import flatbuffers
 from flatbuffers import encode, number_types, packer, table
 
+from ._json import dumps, loads
+from .subscriptions import encode_event
+
 WireFormat = Literal["json", "flatbuffers"]
 
 
@@ -37,6 +40,8 @@ _TYPE_TO_NAME = {
 
 _NAME_TO_TYPE = {value: key for key, value in _TYPE_TO_NAME.items()}
 
+_EVENT_FRAME_KEYS = {"type", "sub_id", "event"}
+
 
 @dataclass
 class DecodedMessage:
@@ -57,17 +62,13 @@ def decode_message(raw: bytes | str, *, fmt: WireFormat) -> DecodedMessage:
 
 
 def _encode_json(payload: dict[str, Any]) -> bytes:
-    import json
-
-    return json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    if payload.keys() == _EVENT_FRAME_KEYS and payload["type"] == "event":
+        return b'{"type":"event","sub_id":' + dumps(payload["sub_id"]) + b',"event":' + encode_event(payload["event"], dumps) + b"}"
+    return dumps(payload)
 
 
 def _decode_json(raw: bytes | str) -> DecodedMessage:
-    import json
-
-    if isinstance(raw, bytes):
-        raw = raw.decode("utf-8")
-    message = json.loads(raw)
+    message = loads(raw)
     if not isinstance(message, dict):
         raise ValueError("message must be object")
     msg_type = message.get("type")
@@ -7,7 +7,7 @@ import socket
 
 from aether_relay.core import RelayConfig, RelayCore
 from aether_relay.crypto import compute_event_id, generate_keypair, sign
-from aether_relay.gateways.http import HttpGateway
+from aether_relay.gateways.http import HttpGateway, HttpSubscription
 from aether_relay.storage import InMemoryEventStore
 
 
@@ -106,3 +106,93 @@ def test_http_publish_stream_flow() -> None:
             await http_server.wait_closed()
 
     asyncio.run(run())
+
+
+def test_http_connection_is_reused_across_requests() -> None:
+    def publish_twice(port: int, events: list[dict[str, object]]) -> list[int]:
+        conn = http.client.HTTPConnection("127.0.0.1", port, timeout=5)
+        try:
+            statuses = []
+            for event in events:
+                conn.request("POST", "/v1/events", body=json.dumps({"event": event}), headers={"Content-Type": "application/json"})
+                resp = conn.getresponse()
+                assert resp.getheader("Connection") == "keep-alive"
+                resp.read()
+                statuses.append(resp.status)
+            return statuses
+        finally:
+            conn.close()
+
+    async def run() -> None:
+        core = RelayCore(InMemoryEventStore(), config=RelayConfig(now_ns=lambda: 1))
+        gateway = HttpGateway(core)
+        http_port = _free_port()
+        http_server, ws_server = await gateway.start(host="127.0.0.1", http_port=http_port, ws_port=_free_port())
+        try:
+            private_key, pubkey = generate_keypair()
+            events = [_event(private_key=private_key, pubkey=pubkey, kind=kind) for kind in (1, 2)]
+            assert await asyncio.to_thread(publish_twice, http_port, events) == [200, 200]
+        finally:
+            ws_server.close()
+            await ws_server.wait_closed()
+            http_server.close()
+            await http_server.wait_closed()
+
+    asyncio.run(run())
+
+
+def test_sse_stream_coalesces_queued_events() -> None:
+    class RecordingWriter:
+        def __init__(self) -> None:
+            self.writes: list[bytes] = []
+
+        def write(self, data: bytes) -> None:
+            self.writes.append(data)
+
+        async def drain(self) -> None:
+            if len(self.writes) > 1:
+                raise ConnectionResetError
+
+        def close(self) -> None:
+            pass
+
+        async def wait_closed(self) -> None:
+            pass
+
+    async def run() -> None:
+        gateway = HttpGateway(RelayCore(InMemoryEventStore(), config=RelayConfig(now_ns=lambda: 1)))
+        queue: asyncio.Queue[bytes] = asyncio.Queue()
+        for index in range(3):
+            queue.put_nowait(b'{"n":%d}' % index)
+        gateway._subscriptions["sub"] = HttpSubscription("http-sse-sub", "sub", queue)
+        writer = RecordingWriter()
+        await gateway._handle_sse_stream(writer, "sub")  # type: ignore[arg-type]
+
+        assert len(writer.writes) == 2
+        assert writer.writes[1] == b"".join(
+            b'id: %d\nevent: event\ndata: {"n":%d}\n\n' % (index + 1, index) for index in range(3)
+        )
+
+    asyncio.run(run())
+
+
+def test_http_rejects_oversized_request_head() -> None:
+    async def run() -> None:
+        gateway = HttpGateway(RelayCore(InMemoryEventStore(), config=RelayConfig(now_ns=lambda: 1)))
+        http_port = _free_port()
+        http_server, ws_server = await gateway.start(host="127.0.0.1", http_port=http_port, ws_port=_free_port())
+        try:
+            reader, writer = await asyncio.open_connection("127.0.0.1", http_port)
+            writer.write(b"GET /healthz HTTP/1.1\r\nX-Padding: " + b"a" * 70_000 + b"\r\n\r\n")
+            await writer.drain()
+            status_line = await asyncio.wait_for(reader.readline(), timeout=5)
+            assert status_line.startswith(b"HTTP/1.1 431 ")
+            writer.close()
+            await writer.wait_closed()
+        finally:
+            ws_server.close()
+            await ws_server.wait_closed()
+            http_server.close()
+            await http_server.wait_closed()
+
+    asyncio.run(run())
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import json
+
 import pytest
 
 from aether_relay.capabilities import CapabilityToken, enforce_capability, sign_token, verify_chain
@@ -75,7 +77,60 @@ def test_enforce_capability_rejects_wrong_capability() -> None:
         enforce_capability([token], required="service:resource:write", now_ns=1)
 
 
+def test_verify_chain_parallel_path_detects_bad_link(monkeypatch: pytest.MonkeyPatch) -> None:
+    from aether_relay import capabilities
+
+    monkeypatch.setattr(capabilities.os, "cpu_count", lambda: 4)
+    keys = [generate_keypair() for _ in range(9)]
+    chain = [
+        sign_token(
+            issuer_private_key=keys[index][0],
+            subject=keys[index + 1][1],
+            capability="service:resource:read",
+            caveats={},
+        )
+        for index in range(8)
+    ]
+    verify_chain(chain, now_ns=1)
+
+    chain[5] = CapabilityToken(
+        issuer=chain[5].issuer,
+        subject=chain[5].subject,
+        capability="service:resource:write",
+        caveats=chain[5].caveats,
+        sig=chain[5].sig,
+    )
+    with pytest.raises(ValueError, match="invalid capability signature"):
+        verify_chain(chain, now_ns=1)
+
+
 def token_id(token: CapabilityToken) -> bytes:
     from aether_relay.capabilities import compute_token_id
 
     return compute_token_id(token)
+
+
+def test_token_payload_ignores_json_backend(monkeypatch: pytest.MonkeyPatch) -> None:
+    from aether_relay import _json
+    from aether_relay.capabilities import _serialize_payload
+
+    token = CapabilityToken(
+        issuer=b"\x01" * 32,
+        subject=b"\x02" * 32,
+        capability='service:r\u00e9sum\u00e9:"read"',
+        caveats={"max_uses": 3, "ratio": 1e16, "tiny": 1e-7, "nonce": 2**70, "label": "caf\u00e9"},
+        sig=b"",
+    )
+    expected = json.dumps(
+        {
+            "issuer": token.issuer.hex(),
+            "subject": token.subject.hex(),
+            "capability": token.capability,
+            "caveats": token.caveats,
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+    ).encode("utf-8")
+    assert _serialize_payload(token) == expected
+    monkeypatch.setattr(_json, "orjson", None)
+    assert _serialize_payload(token) == expected
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
 import asyncio
+import json
+
+import pytest
 
 from aether_relay.core import RelayCore, RelayConfig
 from aether_relay.crypto import compute_event_id, generate_keypair, sign
 from aether_relay.limits import RateLimiter
 from aether_relay.storage import InMemoryEventStore
+from aether_relay.wire import encode_message
 
 
 def _event(*, pubkey: bytes, kind: int, created_at: int, private_key: bytes) -> dict[str, object]:
@@ -43,6 +47,26 @@ def test_publish_routes_to_subscribers() -> None:
     assert sent[0]["message"]["type"] == "event"
 
 
+def test_publish_survives_failing_subscriber(caplog: pytest.LogCaptureFixture) -> None:
+    store = InMemoryEventStore()
+    core = RelayCore(store, config=RelayConfig(now_ns=lambda: 1))
+    core.subscribe("conn-dead", "sub-1", [{"kinds": [1]}])
+    core.subscribe("conn-live", "sub-1", [{"kinds": [1]}])
+    private_key, pubkey = generate_keypair()
+    event = _event(pubkey=pubkey, kind=1, created_at=1, private_key=private_key)
+    delivered: list[str] = []
+
+    async def send(conn_id: str, _message: dict[str, object]) -> None:
+        if conn_id == "conn-dead":
+            raise ConnectionError("closed")
+        delivered.append(conn_id)
+
+    asyncio.run(core.publish("conn-live", event, send))
+    assert delivered == ["conn-live"]
+    assert core.failed_deliveries == 1
+    assert "ConnectionError('closed')" in caplog.text
+
+
 def test_publish_applies_rate_limit() -> None:
     store = InMemoryEventStore()
     limiter = RateLimiter(capacity=0, refill_per_second=0.0, now_ns=lambda: 0)
@@ -77,3 +101,26 @@ def test_publish_forwards_to_gossip() -> None:
 
     asyncio.run(core.publish("conn-1", event, send))
     assert forwarded
+    gossiped = json.loads(forwarded[0])
+    assert list(gossiped) == sorted(gossiped)
+    assert gossiped["pubkey"] == pubkey.hex()
+
+
+def test_publish_encodes_each_publish_of_a_reused_dict() -> None:
+    core = RelayCore(InMemoryEventStore(), config=RelayConfig(now_ns=lambda: 1))
+    core.subscribe("conn-1", "sub-1", [{"kinds": [1]}])
+    core.subscribe("conn-2", "sub-2", [{"kinds": [1]}])
+    private_key, pubkey = generate_keypair()
+    frames: list[bytes] = []
+
+    async def send(_conn_id: str, message: dict[str, object]) -> None:
+        frames.append(encode_message(message, fmt="json"))
+
+    event: dict[str, object] = {}
+    for created_at in (1, 2):
+        raw = _event(pubkey=pubkey, kind=1, created_at=created_at, private_key=private_key)
+        event.clear()
+        event.update({key: value.hex() if isinstance(value, bytes) else value for key, value in raw.items()})
+        asyncio.run(core.publish("conn-1", event, send))
+
+    assert [json.loads(frame)["event"]["created_at"] for frame in frames] == [1, 1, 2, 2]
@@ -3,15 +3,19 @@ from __future__ import annotations
 from pathlib import Path
 from typing import TypedDict, cast
 
+import pytest
 import yaml
 
 from aether_relay.crypto import (
     Tag,
+    _cached_pubkey_fromhex,
     compute_event_id,
     generate_keypair,
     normalize_tags,
+    parse_hex_field,
     sign,
     verify,
+    verify_batch,
 )
 
 
@@ -76,3 +80,30 @@ def _load_vectors() -> list[EventVector]:
         if not isinstance(item, dict):
             raise AssertionError("valid-events.yaml entries must be mappings")
     return cast(list[EventVector], data)
+
+
+def test_verify_batch_rejects_any_bad_signature() -> None:
+    private_key, public_key = generate_keypair()
+    event_ids = [bytes([index]) * 32 for index in range(3)]
+    sigs = [sign(event_id, private_key) for event_id in event_ids]
+    pubkeys = [public_key] * 3
+    assert verify_batch(event_ids, sigs, pubkeys) is True
+    assert verify_batch(event_ids, [sigs[0], sigs[2], sigs[1]], pubkeys) is False
+
+
+def test_sign_with_alternating_keys() -> None:
+    keys = [generate_keypair() for _ in range(2)]
+    event_id = b"\x07" * 32
+    for _ in range(2):
+        for private_key, public_key in keys:
+            assert verify(event_id, sign(event_id, private_key), public_key) is True
+
+
+def test_pubkey_hex_cache_holds_only_key_sized_strings() -> None:
+    _cached_pubkey_fromhex.cache_clear()
+    assert parse_hex_field("pubkey", "ab" * 32) == b"\xab" * 32
+    assert parse_hex_field("pubkey", "ab" * 1000) == b"\xab" * 1000
+    assert parse_hex_field("event_id", "cd" * 32) == b"\xcd" * 32
+    with pytest.raises(ValueError):
+        parse_hex_field("pubkey", "zz" * 32)
+    assert _cached_pubkey_fromhex.cache_info().currsize == 1
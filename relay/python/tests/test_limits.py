@@ -32,3 +32,23 @@ def test_compute_event_size_and_max_size() -> None:
     enforce_max_size(event, max_bytes=size)
     with pytest.raises(ValueError, match="maximum size"):
         enforce_max_size(event, max_bytes=size - 1)
+
+
+def test_compute_event_size_counts_serialized_tags() -> None:
+    event = _event(content=b"")
+    event["tags"] = [["e", "abc", "wss://relay"], ["p", "é"]]
+    bare = compute_event_size(_event(content=b""))
+    # key_len(1) + key + values_len(2) + per-value (len(2) + bytes)
+    assert compute_event_size(event) == bare + (3 + 1 + 2 + 3 + 2 + 11) + (3 + 1 + 2 + 2)
+
+
+def test_rate_limiter_refills_per_pubkey() -> None:
+    now = [0]
+    limiter = RateLimiter(capacity=1, refill_per_second=1.0, now_ns=lambda: now[0])
+    first, second = b"\x04" * 32, b"\x05" * 32
+    assert limiter.allow(first) is True
+    assert limiter.allow(first) is False
+    assert limiter.allow(second) is True
+    now[0] = 1_000_000_000
+    assert limiter.allow(first) is True
+    assert limiter.allow(first) is False
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import pytest
+from cryptography.exceptions import InvalidTag
+
+from aether_relay.noise import NoiseSession, derive_shared_key, generate_keypair
+
+
+def test_noise_session_round_trip() -> None:
+    client_private, client_public = generate_keypair()
+    relay_private, relay_public = generate_keypair()
+    key = derive_shared_key(client_private, relay_public)
+    assert key == derive_shared_key(relay_private, client_public)
+
+    sender = NoiseSession(key)
+    receiver = NoiseSession(key)
+    first = sender.encrypt(b"hello")
+    second = sender.encrypt(b"hello")
+    assert first[:8] == (0).to_bytes(8, "big")
+    assert second[:8] == (1).to_bytes(8, "big")
+    assert first != second
+    assert receiver.decrypt(second) == b"hello"
+    assert receiver.decrypt(first) == b"hello"
+
+    with pytest.raises(InvalidTag):
+        receiver.decrypt(second[:8] + bytes([second[8] ^ 1]) + second[9:])
+    with pytest.raises(ValueError, match="too short"):
+        receiver.decrypt(b"\x00" * 7)
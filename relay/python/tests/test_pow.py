@@ -9,11 +9,16 @@ def test_leading_zero_bits() -> None:
     assert leading_zero_bits(b"\x00") == 8
     assert leading_zero_bits(b"\x00\x00") == 16
     assert leading_zero_bits(b"\x10") == 3
+    assert leading_zero_bits(b"") == 0
+    assert leading_zero_bits(b"\x00" * 31 + b"\x01") == 255
 
 
 def test_meets_difficulty() -> None:
     assert meets_difficulty(b"\x00\x00", 12) is True
     assert meets_difficulty(b"\x10", 4) is False
+    assert meets_difficulty(b"\x00\x01", 15) is True
+    assert meets_difficulty(b"\x00\x01", 16) is False
+    assert meets_difficulty(b"\x00", 9) is False
 
 
 def test_validate_pow() -> None:
@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from collections.abc import Callable
+from itertools import pairwise
+
+from aioquic.quic.events import StreamDataReceived
+from aioquic.quic.packet import QuicErrorCode
+
+from aether_relay.core import RelayConfig, RelayCore
+from aether_relay.quic_transport import MAX_PENDING_FRAMES, QuicRelayProtocol
+from aether_relay.storage import InMemoryEventStore
+
+
+class _RecordingQuic:
+    """Stand-in for QuicConnection that records what the protocol sends."""
+
+    def __init__(self) -> None:
+        self.sent: list[tuple[int, bytes]] = []
+        self.resets: list[tuple[int, int]] = []
+        self.stops: list[tuple[int, int]] = []
+
+    def send_stream_data(self, stream_id: int, data: bytes, end_stream: bool = False) -> None:
+        self.sent.append((stream_id, data))
+
+    def reset_stream(self, stream_id: int, error_code: int) -> None:
+        self.resets.append((stream_id, error_code))
+
+    def stop_stream(self, stream_id: int, error_code: int) -> None:
+        self.stops.append((stream_id, error_code))
+
+    def datagrams_to_send(self, now: float) -> list[tuple[bytes, object]]:
+        return []
+
+    def get_timer(self) -> float | None:
+        return None
+
+    def replies(self, stream_id: int) -> list[dict[str, object]]:
+        messages = []
+        for sent_stream, data in self.sent:
+            if sent_stream == stream_id:
+                assert int.from_bytes(data[:4], "big") == len(data) - 4
+                messages.append(json.loads(data[4:]))
+        return messages
+
+
+def _protocol() -> tuple[QuicRelayProtocol, _RecordingQuic]:
+    quic = _RecordingQuic()
+    core = RelayCore(InMemoryEventStore(), config=RelayConfig(now_ns=lambda: 1))
+    protocol = QuicRelayProtocol(quic, core=core)  # type: ignore[arg-type]
+    protocol.connection_made(object())  # type: ignore[arg-type]
+    return protocol, quic
+
+
+def _frame(payload: dict[str, object]) -> bytes:
+    data = json.dumps(payload).encode("utf-8")
+    return len(data).to_bytes(4, "big") + data
+
+
+def _hello() -> bytes:
+    return _frame({"type": "hello", "version": 1, "formats": ["json"]})
+
+
+def _subscribe(sub_id: str) -> bytes:
+    return _frame({"type": "subscribe", "sub_id": sub_id, "filters": [{"kinds": [1]}]})
+
+
+def _receive(protocol: QuicRelayProtocol, stream_id: int, data: bytes) -> None:
+    protocol.quic_event_received(StreamDataReceived(data=data, end_stream=False, stream_id=stream_id))
+
+
+async def _wait_for(condition: Callable[[], bool]) -> None:
+    for _ in range(1000):
+        if condition():
+            return
+        await asyncio.sleep(0)
+    raise AssertionError("condition not reached")
+
+
+def test_quic_handles_pipelined_frames_in_order() -> None:
+    async def run() -> None:
+        protocol, quic = _protocol()
+        _receive(protocol, 0, _hello() + b"".join(_subscribe(f"sub-{index}") for index in range(5)))
+        _receive(protocol, 4, _subscribe("other"))
+        await _wait_for(lambda: len(quic.sent) == 7)
+
+        replies = quic.replies(0)
+        assert replies[0]["type"] == "welcome"
+        assert [reply["sub_id"] for reply in replies[1:]] == [f"sub-{index}" for index in range(5)]
+        assert quic.replies(4) == [{"type": "subscribed", "sub_id": "other"}]
+
+        worker = protocol._worker
+        assert worker is not None
+        protocol.connection_lost(None)
+        await asyncio.sleep(0)
+        assert protocol._worker is None
+        assert worker.cancelled()
+
+    asyncio.run(run())
+
+
+def test_quic_reassembles_frames_split_across_events() -> None:
+    async def run() -> None:
+        protocol, quic = _protocol()
+        data = _hello() + _subscribe("split")
+        # Cut inside the first length prefix, mid-payload and at the frame boundary.
+        cuts = [0, 2, 9, len(_hello()), len(_hello()) + 3, len(data)]
+        for start, end in pairwise(cuts):
+            _receive(protocol, 0, data[start:end])
+        await _wait_for(lambda: len(quic.sent) == 2)
+
+        assert [reply["type"] for reply in quic.replies(0)] == ["welcome", "subscribed"]
+        assert protocol._buffers[0] == (bytearray(), 0)
+        protocol.connection_lost(None)
+
+    asyncio.run(run())
+
+
+def test_quic_splits_several_frames_from_one_event() -> None:
+    async def run() -> None:
+        protocol, quic = _protocol()
+        partial = _subscribe("partial")
+        _receive(protocol, 0, _hello() + _subscribe("a") + _subscribe("b") + partial[:5])
+        await _wait_for(lambda: len(quic.sent) == 3)
+
+        assert [reply.get("sub_id") for reply in quic.replies(0)] == [None, "a", "b"]
+        # Most of the buffer was consumed, so it is compacted down to the partial frame.
+        assert protocol._buffers[0] == (bytearray(partial[:5]), 0)
+
+        _receive(protocol, 0, partial[5:])
+        await _wait_for(lambda: len(quic.sent) == 4)
+        assert quic.replies(0)[-1]["sub_id"] == "partial"
+        protocol.connection_lost(None)
+
+    asyncio.run(run())
+
+
+def test_quic_compacts_buffer_lazily() -> None:
+    async def run() -> None:
+        protocol, quic = _protocol()
+        hello = _hello()
+        large = _subscribe("x" * 200)
+        _receive(protocol, 0, hello + large[:100])
+
+        # The consumed prefix is under half the buffer, so it is kept with an offset.
+        buffer, offset = protocol._buffers[0]
+        assert offset == len(hello)
+        assert bytes(buffer) == hello + large[:100]
+
+        _receive(protocol, 0, large[100:])
+        assert protocol._buffers[0] == (bytearray(), 0)
+        await _wait_for(lambda: len(quic.sent) == 2)
+        assert quic.replies(0)[-1]["sub_id"] == "x" * 200
+        protocol.connection_lost(None)
+
+    asyncio.run(run())
+
+
+def test_quic_resets_stream_when_pending_frames_overflow() -> None:
+    async def run() -> None:
+        protocol, quic = _protocol()
+        _receive(protocol, 4, _hello())
+        # Nothing is handled until the loop runs, so the queue fills up here.
+        _receive(protocol, 0, b"".join(_subscribe(f"sub-{index}") for index in range(MAX_PENDING_FRAMES + 1)))
+
+        assert quic.resets == [(0, QuicErrorCode.FLOW_CONTROL_ERROR)]
+        assert quic.stops == [(0, QuicErrorCode.FLOW_CONTROL_ERROR)]
+        assert 0 in protocol._aborted
+
+        pending = protocol._rx.qsize()
+        _receive(protocol, 0, _subscribe("late"))
+        assert protocol._rx.qsize() == pending
+        assert 0 not in protocol._buffers
+
+        await _wait_for(protocol._rx.empty)
+        _receive(protocol, 4, _subscribe("other"))
+        await _wait_for(lambda: len(quic.replies(4)) == 2)
+
+        assert quic.replies(0) == []
+        assert [reply["type"] for reply in quic.replies(4)] == ["welcome", "subscribed"]
+        assert len(quic.resets) == 1
+        protocol.connection_lost(None)
+
+    asyncio.run(run())
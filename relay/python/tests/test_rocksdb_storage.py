@@ -1,8 +1,27 @@
 from __future__ import annotations
 
+import json
+import sys
+import types
+
 import pytest
 
 from aether_relay.storage import RocksDBEventStore
+from aether_relay.storage.rocksdb import (
+    _INDEX_VERSION,
+    _INDEX_VERSION_KEY,
+    _decode_event,
+    _encode_event,
+    _kind_index_key,
+    _kind_index_prefix,
+    _normalize_event,
+    _pubkey_index_key,
+    _pubkey_index_prefix,
+    _record_summary,
+    _tag_index_key,
+    _tag_index_prefix,
+    _time_index_key,
+)
 
 
 def _event(
@@ -24,6 +43,145 @@ def _event(
     }
 
 
+class _MemoryWriteBatch:
+    def __init__(self) -> None:
+        self.ops: list[tuple[bytes, bytes | None]] = []
+
+    def put(self, key: bytes, value: bytes) -> None:
+        self.ops.append((key, value))
+
+    def delete(self, key: bytes) -> None:
+        self.ops.append((key, None))
+
+
+class _MemoryDB:
+    """Ordered key/value stand-in for the subset of the rocksdb.DB API the store uses."""
+
+    def __init__(self, path: str, options: object) -> None:
+        self.data: dict[bytes, bytes] = {}
+
+    def get(self, key: bytes) -> bytes | None:
+        return self.data.get(key)
+
+    def multi_get(self, keys: list[bytes]) -> dict[bytes, bytes | None]:
+        return {key: self.data.get(key) for key in keys}
+
+    def iterator(self, *, prefix: bytes):
+        return iter(sorted((key, value) for key, value in self.data.items() if key.startswith(prefix)))
+
+    def write(self, batch: _MemoryWriteBatch) -> None:
+        for key, value in batch.ops:
+            if value is None:
+                self.data.pop(key, None)
+            else:
+                self.data[key] = value
+
+
+@pytest.fixture
+def memory_rocksdb(monkeypatch):
+    module = types.SimpleNamespace(
+        DB=_MemoryDB,
+        Options=lambda **kwargs: kwargs,
+        WriteBatch=_MemoryWriteBatch,
+    )
+    monkeypatch.setitem(sys.modules, "rocksdb", module)
+    return module
+
+
+def test_rocksdb_record_round_trip() -> None:
+    event = _event(
+        event_id=b"\x20" * 32,
+        pubkey=b"\x21" * 32,
+        kind=30001,
+        created_at=2**40,
+        tags=[["d", "caf\u00e9"], ["t", "a:b", "c"]],
+    )
+    event["content"] = "h\u00e9llo"
+    record = _encode_event(_normalize_event(event))
+
+    assert _decode_event(record) == {
+        "event_id": b"\x20" * 32,
+        "pubkey": b"\x21" * 32,
+        "kind": 30001,
+        "created_at": 2**40,
+        "d_tag": "caf\u00e9",
+        "tags": [["d", "caf\u00e9"], ["t", "a:b", "c"]],
+        "content": "h\u00e9llo".encode("utf-8"),
+        "sig": b"\x00" * 64,
+    }
+    assert _record_summary(record) == (30001, b"\x21" * 32, 2**40)
+
+
+def test_rocksdb_decodes_legacy_json_records() -> None:
+    record = json.dumps(
+        {
+            "event_id": "30" * 32,
+            "pubkey": "31" * 32,
+            "kind": 1,
+            "created_at": 7,
+            "d_tag": "",
+            "tags": [["t", "x"]],
+            "content": b"hi".hex(),
+            "sig": "00" * 64,
+        },
+        separators=(",", ":"),
+        sort_keys=True,
+    ).encode("utf-8")
+
+    decoded = _decode_event(record)
+    assert decoded["event_id"] == b"\x30" * 32
+    assert decoded["tags"] == [["t", "x"]]
+    assert decoded["content"] == b"hi"
+    assert _record_summary(record) == (1, b"\x31" * 32, 7)
+
+
+def test_rocksdb_index_keys_sort_by_created_at() -> None:
+    event_id = b"\x40" * 32
+    pubkey = b"\x41" * 32
+    kind_keys = [_kind_index_key(1, created_at, event_id) for created_at in (2**33, 5, 256)]
+    assert sorted(kind_keys) == [_kind_index_key(1, created_at, event_id) for created_at in (5, 256, 2**33)]
+    assert all(key.startswith(_kind_index_prefix(1)) for key in kind_keys)
+    assert not _kind_index_key(256, 5, event_id).startswith(_kind_index_prefix(1))
+
+    assert _pubkey_index_key(pubkey, 9, event_id).startswith(_pubkey_index_prefix(pubkey))
+    assert _pubkey_index_key(pubkey, 9, event_id).endswith(event_id)
+    assert _time_index_key(1, event_id) < _time_index_key(2, b"\x00" * 32)
+
+    assert _tag_index_key("t", "a", event_id) == _tag_index_prefix("t", "a") + event_id
+    assert len(_tag_index_key("t", "a:b", event_id)) != len(_tag_index_prefix("t", "a")) + 32
+
+
+def test_rocksdb_query_returns_events_in_event_id_order(tmp_path, memory_rocksdb) -> None:
+    store = RocksDBEventStore(str(tmp_path / "rocksdb"))
+    pubkey = b"\x0d" * 32
+    for marker, created_at in ((0x93, 1), (0x91, 3), (0x92, 2)):
+        store.insert(_event(event_id=bytes([marker]) * 32, pubkey=pubkey, kind=1, created_at=created_at))
+
+    expected = [bytes([marker]) * 32 for marker in (0x91, 0x92, 0x93)]
+    assert [entry["event_id"] for entry in store.query()] == expected
+    assert [entry["event_id"] for entry in store.query(kinds=[1], pubkeys=[pubkey])] == expected
+    assert [entry["event_id"] for entry in store.query(since=1, until=3)] == expected
+
+
+def test_rocksdb_builds_time_indexes_for_legacy_databases(tmp_path, memory_rocksdb) -> None:
+    store = RocksDBEventStore(str(tmp_path / "rocksdb"))
+    store.insert(_event(event_id=b"\x50" * 32, pubkey=b"\x51" * 32, kind=1, created_at=10))
+    store.insert(_event(event_id=b"\x52" * 32, pubkey=b"\x51" * 32, kind=1, created_at=20))
+    legacy = {key: value for key, value in store._db.data.items() if key.startswith(b"e:")}
+
+    memory_rocksdb.DB = lambda path, options: _prefilled(legacy)
+    reopened = RocksDBEventStore(str(tmp_path / "rocksdb"))
+
+    assert reopened._db.get(_INDEX_VERSION_KEY) == _INDEX_VERSION
+    assert [entry["event_id"] for entry in reopened.query(kinds=[1], since=15)] == [b"\x52" * 32]
+
+
+def _prefilled(data: dict[bytes, bytes]) -> _MemoryDB:
+    db = _MemoryDB("", None)
+    db.data.update(data)
+    return db
+
+
 def test_rocksdb_insert_and_query(tmp_path) -> None:
     pytest.importorskip("rocksdb")
     store = RocksDBEventStore(str(tmp_path / "rocksdb"))
@@ -32,3 +190,46 @@ def test_rocksdb_insert_and_query(tmp_path) -> None:
     assert store.insert(event) is True
     stored = store.query(kinds=[1], pubkeys=[pubkey])
     assert stored[0]["event_id"] == event["event_id"]
+
+
+def test_rocksdb_query_uses_time_bounds(tmp_path) -> None:
+    pytest.importorskip("rocksdb")
+    store = RocksDBEventStore(str(tmp_path / "rocksdb"))
+    alice = b"\x0a" * 32
+    bob = b"\x0b" * 32
+    store.insert(_event(event_id=b"\x80" * 32, pubkey=alice, kind=1, created_at=10))
+    store.insert(_event(event_id=b"\x81" * 32, pubkey=alice, kind=2, created_at=20))
+    store.insert(_event(event_id=b"\x82" * 32, pubkey=bob, kind=1, created_at=30))
+
+    results = store.query(kinds=[1, 2], pubkeys=[alice], since=15)
+    assert [entry["event_id"] for entry in results] == [b"\x81" * 32]
+    assert [entry["event_id"] for entry in store.query(kinds=[1], until=20)] == [b"\x80" * 32]
+
+
+def test_rocksdb_time_range_query(tmp_path) -> None:
+    pytest.importorskip("rocksdb")
+    store = RocksDBEventStore(str(tmp_path / "rocksdb"))
+    pubkey = b"\x0c" * 32
+    for index, created_at in enumerate((5, 10, 15, 20)):
+        store.insert(_event(event_id=bytes([index + 1]) * 32, pubkey=pubkey, kind=1, created_at=created_at))
+
+    results = store.query(since=10, until=15)
+    assert sorted(entry["created_at"] for entry in results) == [10, 15]
+
+
+def test_rocksdb_query_ignores_kinds_outside_uint16(tmp_path, memory_rocksdb) -> None:
+    store = RocksDBEventStore(str(tmp_path / "rocksdb"))
+    store.insert(_event(event_id=b"\x60" * 32, pubkey=b"\x61" * 32, kind=1, created_at=1))
+
+    assert store.query(kinds=[70000]) == []
+    assert store.query(kinds=[-1]) == []
+    assert store.query(kinds=["1"]) == []  # type: ignore[list-item]
+    assert [entry["event_id"] for entry in store.query(kinds=[70000, 1])] == [b"\x60" * 32]
+
+
+def test_rocksdb_rejects_created_at_outside_uint64(tmp_path, memory_rocksdb) -> None:
+    store = RocksDBEventStore(str(tmp_path / "rocksdb"))
+    for created_at in (-1, 2**64):
+        with pytest.raises(ValueError, match="created_at"):
+            store.insert(_event(event_id=b"\x62" * 32, pubkey=b"\x63" * 32, kind=1, created_at=created_at))
+    assert store.query() == []
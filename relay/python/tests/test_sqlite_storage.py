@@ -52,3 +52,31 @@ def test_sqlite_replaceable_overwrite(tmp_path) -> None:
     assert len(stored) == 1
     assert stored[0]["event_id"] == newer["event_id"]
     store.close()
+
+
+def test_sqlite_parameterized_replace_by_d_tag(tmp_path) -> None:
+    store = SQLiteEventStore(tmp_path / "events.db")
+    pubkey = b"\x03" * 32
+    first = _event(event_id=b"\x30" * 32, pubkey=pubkey, kind=30_000, created_at=10, tags=[["d", "a"]])
+    other = _event(event_id=b"\x31" * 32, pubkey=pubkey, kind=30_000, created_at=10, tags=[["d", "b"]])
+    stale = _event(event_id=b"\x32" * 32, pubkey=pubkey, kind=30_000, created_at=5, tags=[["d", "a"]])
+
+    assert store.insert(first) is True
+    assert store.insert(other) is True
+    assert store.insert(stale) is False
+    stored = store.query(kinds=[30_000], pubkeys=[pubkey])
+    assert {entry["event_id"] for entry in stored} == {first["event_id"], other["event_id"]}
+    store.close()
+
+
+def test_sqlite_query_requires_every_tag(tmp_path) -> None:
+    store = SQLiteEventStore(tmp_path / "events.db")
+    pubkey = b"\x02" * 32
+    both = _event(event_id=b"\x20" * 32, pubkey=pubkey, kind=1, created_at=1, tags=[["c", "a"], ["t", "x"]])
+    one = _event(event_id=b"\x21" * 32, pubkey=pubkey, kind=1, created_at=2, tags=[["c", "a"]])
+    assert store.insert(both) is True
+    assert store.insert(one) is True
+
+    results = store.query(kinds=[1], tags=[("c", "a"), ("t", "x")])
+    assert [entry["event_id"] for entry in results] == [both["event_id"]]
+    assert len(store.query(tags=[])) == 2
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import pytest
+
 from aether_relay.bloom import BloomFilter
 from aether_relay.storage import InMemoryEventStore
 
@@ -120,6 +122,21 @@ def test_immutable_events_respect_retention_window() -> None:
     assert [entry["event_id"] for entry in stored] == [fresh["event_id"]]
 
 
+def test_retention_evicts_events_as_clock_advances() -> None:
+    clock = [1_000]
+    store = InMemoryEventStore(retention_ns=100, now_ns=lambda: clock[0])
+    pubkey = b"\x06" * 32
+    older = _event(event_id=b"\x62" * 32, pubkey=pubkey, kind=1, created_at=960)
+    newer = _event(event_id=b"\x63" * 32, pubkey=pubkey, kind=1, created_at=990)
+    assert store.insert(newer) is True
+    assert store.insert(older) is True
+
+    clock[0] = 1_070
+    assert [entry["event_id"] for entry in store.query(kinds=[1])] == [newer["event_id"]]
+    clock[0] = 1_100
+    assert store.query(pubkeys=[pubkey]) == []
+
+
 def test_query_filters_by_tags() -> None:
     store = InMemoryEventStore()
     pubkey = b"\x07" * 32
@@ -179,3 +196,88 @@ def test_bloom_filter_rejects_duplicates() -> None:
 
     assert store.insert(event) is True
     assert store.insert(event) is False
+
+
+def test_bloom_filter_has_no_false_negatives() -> None:
+    bloom = BloomFilter(size_bits=4096, hash_count=5)
+    items = [index.to_bytes(32, "big") for index in range(200)]
+    for item in items:
+        bloom.add(item)
+    assert all(bloom.might_contain(item) for item in items)
+
+
+def test_unsupported_kinds_are_rejected() -> None:
+    store = InMemoryEventStore()
+    for kind in (1000, 9999, 40_000, -1):
+        with pytest.raises(ValueError, match="kind out of supported range"):
+            store.insert(_event(event_id=b"\x01" * 32, pubkey=b"\x02" * 32, kind=kind, created_at=1))
+
+
+def test_query_intersects_kind_and_pubkey_indexes() -> None:
+    store = InMemoryEventStore()
+    alice = b"\x0a" * 32
+    bob = b"\x0b" * 32
+    store.insert(_event(event_id=b"\x80" * 32, pubkey=alice, kind=1, created_at=10))
+    store.insert(_event(event_id=b"\x81" * 32, pubkey=alice, kind=2, created_at=20))
+    store.insert(_event(event_id=b"\x82" * 32, pubkey=bob, kind=1, created_at=30))
+
+    results = store.query(kinds=[1, 2], pubkeys=[alice], since=15)
+    assert [entry["event_id"] for entry in results] == [b"\x81" * 32]
+    assert store.query(kinds=[]) == []
+
+
+def test_events_share_interned_pubkey() -> None:
+    store = InMemoryEventStore()
+    first = _event(event_id=b"\x90" * 32, pubkey=bytes(b"\x0c" * 32), kind=1, created_at=1)
+    second = _event(event_id=b"\x91" * 32, pubkey=bytes.fromhex("0c" * 32), kind=1, created_at=2)
+    store.insert(first)
+    store.insert(second)
+
+    stored = store.query(kinds=[1])
+    assert stored[0]["pubkey"] is stored[1]["pubkey"]
+
+
+def test_query_with_unknown_tag_is_empty() -> None:
+    store = InMemoryEventStore()
+    store.insert(_event(event_id=b"\xa0" * 32, pubkey=b"\x0d" * 32, kind=1, created_at=1, tags=[["c", "alpha"]]))
+
+    assert store.query(kinds=[1], tags=[("c", "alpha"), ("c", "missing")]) == []
+    assert len(store.query(kinds=[1], tags=[("c", "alpha")])) == 1
+
+
+def test_bloom_filter_update_merges_members() -> None:
+    left = BloomFilter(size_bits=4096, hash_count=5)
+    right = BloomFilter(size_bits=4096, hash_count=5)
+    left.add_many([b"\x01" * 32, b"\x02" * 32])
+    right.add(b"\x03" * 32)
+
+    left.update(right)
+    assert all(left.might_contain(bytes([value]) * 32) for value in (1, 2, 3))
+    with pytest.raises(ValueError):
+        left.update(BloomFilter(size_bits=128, hash_count=5))
+
+
+def test_bloom_filter_union_and_bit_count() -> None:
+    left = BloomFilter(size_bits=4096, hash_count=5)
+    right = BloomFilter(size_bits=4096, hash_count=5)
+    left.add(b"\x01" * 32)
+    right.add(b"\x02" * 32)
+
+    merged = left | right
+    assert merged.might_contain(b"\x01" * 32) and merged.might_contain(b"\x02" * 32)
+    assert not right.might_contain(b"\x01" * 32)
+    assert left.bit_count() == 5
+    assert merged.bit_count() <= left.bit_count() + right.bit_count()
+
+
+def test_bloom_filter_probe_cache_ignores_mutable_buffers() -> None:
+    bloom = BloomFilter(size_bits=4096, hash_count=5)
+    buffer = bytearray(b"\x01" * 32)
+    assert not bloom.might_contain(buffer)
+    buffer[:] = b"\x02" * 32
+    bloom.add(buffer)
+    assert bloom.might_contain(b"\x02" * 32)
+
+    probes = bloom._indices(b"\x03" * 32)
+    assert isinstance(probes, tuple)
+    assert bloom._indices(b"\x03" * 32) is probes
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import cache
 from pathlib import Path
 from typing import TypedDict, cast
 
@@ -9,6 +10,10 @@ import yaml
 from aether_relay.limits import RateLimiter
 from aether_relay.validation import MAX_KIND, WINDOW_NS, validate_event
 
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_ZERO_ID_HEX = "00" * 32
+_BAD_SIG_HEX = "11" * 64
+
 
 class EventVector(TypedDict):
     pubkey: str
@@ -32,28 +37,25 @@ def test_validation_rejects_invalid_vectors() -> None:
 
 
 def test_rejects_event_id_mismatch() -> None:
-    event = _load_vectors("valid-events.yaml")[0].copy()
-    event["event_id"] = "00" * 32
+    event = _mutated(_valid_event(), event_id=_ZERO_ID_HEX)
     with pytest.raises(ValueError, match="event_id mismatch"):
         validate_event(event, now_ns=int(event["created_at"]))
 
 
 def test_rejects_invalid_signature() -> None:
-    event = _load_vectors("valid-events.yaml")[0].copy()
-    event["sig"] = "11" * 64
+    event = _mutated(_valid_event(), sig=_BAD_SIG_HEX)
     with pytest.raises(ValueError, match="invalid signature"):
         validate_event(event, now_ns=int(event["created_at"]))
 
 
 def test_rejects_out_of_range_kind() -> None:
-    event = _load_vectors("valid-events.yaml")[0].copy()
-    event["kind"] = MAX_KIND + 1
+    event = _mutated(_valid_event(), kind=MAX_KIND + 1)
     with pytest.raises(ValueError, match="kind out of range"):
         validate_event(event, now_ns=int(event["created_at"]))
 
 
 def test_rejects_timestamp_outside_window() -> None:
-    event = _load_vectors("valid-events.yaml")[0].copy()
+    event = _valid_event()
     created_at = int(event["created_at"])
     now = created_at - (WINDOW_NS + 1)
     with pytest.raises(ValueError, match="created_at outside allowed window"):
@@ -62,30 +64,39 @@ def test_rejects_timestamp_outside_window() -> None:
 
 def test_rejects_rate_limited_event() -> None:
     limiter = RateLimiter(capacity=1, refill_per_second=0.0, now_ns=lambda: 0)
-    event = _load_vectors("valid-events.yaml")[0].copy()
+    event = _valid_event()
     validate_event(event, rate_limiter=limiter, now_ns=int(event["created_at"]))
     with pytest.raises(ValueError, match="rate limit"):
         validate_event(event, rate_limiter=limiter, now_ns=int(event["created_at"]))
 
 
 def test_rejects_oversized_event() -> None:
-    event = _load_vectors("valid-events.yaml")[0].copy()
-    event["content"] = "x" * 10
+    event = _mutated(_valid_event(), content="x" * 10)
     with pytest.raises(ValueError, match="maximum size"):
         validate_event(event, max_size=1, now_ns=int(event["created_at"]))
 
 
 def test_rejects_pow_failure() -> None:
-    event = _load_vectors("valid-events.yaml")[0].copy()
+    event = _valid_event()
     with pytest.raises(ValueError, match="pow difficulty"):
         validate_event(event, pow_difficulty=8, now_ns=int(event["created_at"]))
 
 
+def _valid_event() -> EventVector:
+    return _load_vectors("valid-events.yaml")[0]
+
+
+def _mutated(base: EventVector, **overrides: object) -> EventVector:
+    return cast(EventVector, {**base, **overrides})
+
+
+# Shared across tests; negative cases derive new dicts via _mutated.
+@cache
 def _load_vectors(name: str) -> list[EventVector]:
     root = Path(__file__).resolve().parents[3]
     vectors_path = root / "spec" / "test-vectors" / name
     with vectors_path.open("r", encoding="utf-8") as handle:
-        data = yaml.safe_load(handle)
+        data = yaml.load(handle, Loader=_YAML_LOADER)
 
     if not isinstance(data, list):
         raise AssertionError(f"{name} must be a list")
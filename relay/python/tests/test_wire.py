@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import json
+
 from aether_relay.wire import decode_message, encode_message
 
 
@@ -15,3 +17,11 @@ def test_flatbuffers_roundtrip() -> None:
     raw = encode_message(payload, fmt="flatbuffers")
     decoded = decode_message(raw, fmt="flatbuffers")
     assert decoded.msg_type == "subscribe"
+
+
+def test_json_event_frames_match_plain_encoding() -> None:
+    event = {"event_id": "ab" * 32, "kind": 1, "content": "héllo", "tags": [["t", "x"]]}
+    for sub_id in ("first", "second"):
+        payload = {"type": "event", "sub_id": sub_id, "event": event}
+        encoded = encode_message(payload, fmt="json")
+        assert json.loads(encoded) == payload
@@ -3,10 +3,14 @@
 from __future__ import annotations
 
 import asyncio
-from dataclasses import dataclass
+import random
+import ssl
+from dataclasses import dataclass, field
+from itertools import chain
 from typing import Any, Callable, Iterable
 
 import websockets
+from websockets.asyncio.client import ClientConnection
 
 from .filters import EventFilter, match_event, normalize_filter
 from .noise import NoiseSession, derive_shared_key, generate_keypair
@@ -16,12 +20,14 @@ from .wire import decode_message, encode_message
 @dataclass
 class ConnectionState:
     url: str
-    websocket: websockets.WebSocketClientProtocol | None
+    websocket: ClientConnection | None
     subscriptions: dict[str, EventFilter]
     reconnect_attempts: int = 0
     format: str = "json"
     noise: NoiseSession | None = None
     noise_priv: bytes | None = None
+    # Subscriptions keyed by filtered kind; None holds filters without kinds.
+    subscriptions_by_kind: dict[int | None, dict[str, EventFilter]] = field(default_factory=dict)
 
 
 class Client:
@@ -31,6 +37,7 @@ class Client:
         self._max_connections = max_connections
         self._connections: dict[str, ConnectionState] = {}
         self._session_tickets: dict[str, bytes] = {}
+        self._tls_contexts: dict[str, ssl.SSLContext] = {}
         self._event_callbacks: list[Callable[[dict[str, Any]], None]] = []
 
     async def connect(self, urls: Iterable[str]) -> None:
@@ -63,7 +70,9 @@ class Client:
         for state in self._connections.values():
             if state.websocket is None:
                 continue
+            _unindex_subscription(state, subscription_id)
             state.subscriptions[subscription_id] = flt
+            _index_subscription(state, subscription_id, flt)
             await self._send(
                 state,
                 {
@@ -77,6 +86,7 @@ class Client:
         for state in self._connections.values():
             if state.websocket is None:
                 continue
+            _unindex_subscription(state, subscription_id)
             state.subscriptions.pop(subscription_id, None)
             await self._send(state, {"type": "unsubscribe", "sub_id": subscription_id})
 
@@ -87,7 +97,8 @@ class Client:
         session_ticket = self._session_tickets.get(state.url)
         websocket = await websockets.connect(
             state.url,
-            extra_headers={"x-session-ticket": session_ticket.hex()} if session_ticket else None,
+            additional_headers={"x-session-ticket": session_ticket.hex()} if session_ticket else None,
+            ssl=self._tls_context(state.url),
         )
         state.websocket = websocket
 
@@ -99,7 +110,7 @@ class Client:
             "formats": ["flatbuffers", "json"],
             "noise": {"required": True, "pubkey": noise_pub.hex()},
         }
-        await websocket.send(encode_message(hello, fmt="json").decode("utf-8"))
+        await websocket.send(encode_message(hello, fmt="json"), text=True)
 
         raw = await websocket.recv()
         decoded = decode_message(raw, fmt="json" if isinstance(raw, str) else "flatbuffers")
@@ -115,13 +126,26 @@ class Client:
             shared = derive_shared_key(state.noise_priv, bytes.fromhex(pub_hex))
             state.noise = NoiseSession(shared)
 
+        state.reconnect_attempts = 0
         asyncio.create_task(self._listen(state))
 
+    def _tls_context(self, url: str) -> ssl.SSLContext | None:
+        """Return a TLS context reused across reconnects to the same wss:// relay."""
+
+        if not url.startswith("wss://"):
+            return None
+        context = self._tls_contexts.get(url)
+        if context is None:
+            context = ssl.create_default_context()
+            self._tls_contexts[url] = context
+        return context
+
     async def _listen(self, state: ConnectionState) -> None:
         assert state.websocket is not None
         while True:
             try:
-                raw = await state.websocket.recv()
+                # JSON arrives in text frames; keep the raw UTF-8 bytes for the decoder.
+                raw = await state.websocket.recv(decode=False)
                 await self._handle_message(state, raw)
             except Exception:
                 await self._schedule_reconnect(state)
@@ -141,7 +165,7 @@ class Client:
         if decoded.msg_type == "event":
             event = decoded.payload.get("event")
             if isinstance(event, dict):
-                for flt in state.subscriptions.values():
+                for flt in _candidate_filters(state, event):
                     if match_event(event, flt):
                         for callback in self._event_callbacks:
                             callback(event)
@@ -153,13 +177,37 @@ class Client:
         if state.noise is not None:
             encrypted = state.noise.encrypt(data)
             data = encode_message({"type": "noise", "payload_hex": encrypted.hex()}, fmt=state.format)
-        if state.format == "json":
-            await state.websocket.send(data.decode("utf-8"))
-        else:
-            await state.websocket.send(data)
+        await state.websocket.send(data, text=state.format == "json")
 
     async def _schedule_reconnect(self, state: ConnectionState) -> None:
         state.reconnect_attempts += 1
-        delay = min(60.0, 2 ** state.reconnect_attempts)
+        # Jitter keeps clients that dropped together from reconnecting in lockstep.
+        delay = min(60.0, 2 ** state.reconnect_attempts * (0.5 + random.random()))
         await asyncio.sleep(delay)
         await self._connect_one(state)
+
+
+def _index_subscription(state: ConnectionState, subscription_id: str, flt: EventFilter) -> None:
+    for kind in flt.kinds if flt.kinds is not None else (None,):
+        state.subscriptions_by_kind.setdefault(kind, {})[subscription_id] = flt
+
+
+def _unindex_subscription(state: ConnectionState, subscription_id: str) -> None:
+    flt = state.subscriptions.get(subscription_id)
+    if flt is None:
+        return
+    for kind in flt.kinds if flt.kinds is not None else (None,):
+        bucket = state.subscriptions_by_kind.get(kind)
+        if bucket is None:
+            continue
+        bucket.pop(subscription_id, None)
+        if not bucket:
+            state.subscriptions_by_kind.pop(kind, None)
+
+
+def _candidate_filters(state: ConnectionState, event: dict[str, Any]) -> Iterable[EventFilter]:
+    kind = event.get("kind")
+    if type(kind) is not int:
+        return state.subscriptions.values()
+    by_kind = state.subscriptions_by_kind
+    return chain(by_kind.get(kind, {}).values(), by_kind.get(None, {}).values())
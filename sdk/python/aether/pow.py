@@ -6,16 +6,7 @@ from blake3 import blake3
 
 
 def leading_zero_bits(data: bytes) -> int:
-    count = 0
-    for byte in data:
-        if byte == 0:
-            count += 8
-            continue
-        for bit in range(7, -1, -1):
-            if byte & (1 << bit):
-                return count
-            count += 1
-    return count
+    return len(data) * 8 - int.from_bytes(data, "big").bit_length()
 
 
 def meets_difficulty(event_id: bytes, difficulty: int) -> bool:
@@ -33,10 +24,16 @@ def compute_pow_nonce(
     content: bytes,
     difficulty: int,
 ) -> tuple[int, bytes]:
+    # The prefix is fixed across attempts: absorb it once and fork the hasher
+    # state per nonce so each iteration only hashes the trailing 8 bytes.
+    prefix = blake3(pubkey + created_at.to_bytes(8, "big") + kind.to_bytes(2, "big") + tags + content)
+    # A 256-bit id has `difficulty` leading zero bits iff it is below this bound.
+    bound = 1 << (256 - min(max(difficulty, 0), 256))
     nonce = 0
     while True:
-        payload = pubkey + created_at.to_bytes(8, "big") + kind.to_bytes(2, "big") + tags + content + nonce.to_bytes(8, "big")
-        event_id = blake3(payload).digest()
-        if meets_difficulty(event_id, difficulty):
+        hasher = prefix.copy()
+        hasher.update(nonce.to_bytes(8, "big"))
+        event_id = hasher.digest()
+        if int.from_bytes(event_id, "big") < bound:
             return nonce, event_id
         nonce += 1
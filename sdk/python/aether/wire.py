@@ -8,6 +8,8 @@ from typing import Any, Literal
 import flatbuffers
 from flatbuffers import encode, number_types, packer, table
 
+from ._json import dumps, loads
+
 WireFormat = Literal["json", "flatbuffers"]
 
 
@@ -57,17 +59,11 @@ def decode_message(raw: bytes | str, *, fmt: WireFormat) -> DecodedMessage:
 
 
 def _encode_json(payload: dict[str, Any]) -> bytes:
-    import json
-
-    return json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return dumps(payload)
 
 
 def _decode_json(raw: bytes | str) -> DecodedMessage:
-    import json
-
-    if isinstance(raw, bytes):
-        raw = raw.decode("utf-8")
-    message = json.loads(raw)
+    message = loads(raw)
     if not isinstance(message, dict):
         raise ValueError("message must be object")
     msg_type = message.get("type")
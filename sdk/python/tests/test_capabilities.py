@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import json
+
 import pytest
 
-from aether.capabilities import sign_token, verify_chain
+from aether import _json
+from aether.capabilities import CapabilityToken, _serialize_payload, sign_token, verify_chain
 from aether.crypto import generate_keypair
 
 
@@ -24,6 +27,19 @@ def test_verify_chain_passes() -> None:
     verify_chain([token1, token2], now_ns=1)
 
 
+def test_sign_token_sets_issuer_public_key() -> None:
+    issuer_priv, issuer_pub = generate_keypair()
+    token = sign_token(
+        issuer_private_key=issuer_priv,
+        subject=issuer_pub,
+        capability="service:resource:read",
+        caveats={},
+    )
+    assert token.issuer == issuer_pub
+    assert token.issuer != issuer_priv
+    verify_chain([token], now_ns=1)
+
+
 def test_verify_chain_rejects_expired() -> None:
     issuer_priv, issuer_pub = generate_keypair()
     token1 = sign_token(
@@ -53,3 +69,49 @@ def test_verify_chain_rejects_subject_mismatch() -> None:
     )
     with pytest.raises(ValueError, match="subject mismatch"):
         verify_chain([token1, token2], now_ns=1)
+
+
+def test_token_payload_is_canonical_without_orjson(monkeypatch: pytest.MonkeyPatch) -> None:
+    token = CapabilityToken(
+        issuer=b"\x01" * 32,
+        subject=b"\x02" * 32,
+        capability="service:resource:read",
+        caveats={"not_before": 0, "max_uses": 3},
+        sig=b"",
+    )
+    fast = _serialize_payload(token)
+    monkeypatch.setattr(_json, "orjson", None)
+    assert _serialize_payload(token) == fast
+    assert fast == _json.dumps(
+        {
+            "issuer": token.issuer.hex(),
+            "subject": token.subject.hex(),
+            "capability": token.capability,
+            "caveats": token.caveats,
+        },
+        sort_keys=True,
+    )
+
+
+def test_token_payload_ignores_json_backend(monkeypatch: pytest.MonkeyPatch) -> None:
+    token = CapabilityToken(
+        issuer=b"\x01" * 32,
+        subject=b"\x02" * 32,
+        capability='service:r\u00e9sum\u00e9:"read"',
+        caveats={"max_uses": 3, "ratio": 1e16, "tiny": 1e-7, "nonce": 2**70, "label": "caf\u00e9"},
+        sig=b"",
+    )
+    expected = json.dumps(
+        {
+            "issuer": token.issuer.hex(),
+            "subject": token.subject.hex(),
+            "capability": token.capability,
+            "caveats": token.caveats,
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+    ).encode("utf-8")
+    assert b'"ratio":1e+16' in expected and b"caf\\u00e9" in expected
+    assert _serialize_payload(token) == expected
+    monkeypatch.setattr(_json, "orjson", None)
+    assert _serialize_payload(token) == expected
@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+import asyncio
+import json
+
+from aether.client import Client, ConnectionState
 from aether.filters import match_event, normalize_filter
 
 
@@ -13,3 +17,27 @@ def test_filter_matches_event() -> None:
         "content": "",
     }
     assert match_event(event, flt) is True
+
+
+def test_client_dispatches_only_to_matching_kind() -> None:
+    class _FakeWebSocket:
+        async def send(self, _data: object, *, text: bool | None = None) -> None:
+            return None
+
+    client = Client()
+    state = ConnectionState(url="ws://relay", websocket=_FakeWebSocket(), subscriptions={})  # type: ignore[arg-type]
+    client._connections[state.url] = state
+    received: list[dict[str, object]] = []
+    client.on_event(received.append)
+
+    async def run() -> None:
+        await client.subscribe("notes", {"kinds": [1]})
+        await client.subscribe("all", {})
+        await client.unsubscribe("all")
+        for kind in (1, 2):
+            event = {"pubkey": "01" * 32, "kind": kind, "created_at": 10, "tags": [], "content": ""}
+            await client._handle_message(state, json.dumps({"type": "event", "sub_id": "notes", "event": event}))
+
+    asyncio.run(run())
+    assert [event["kind"] for event in received] == [1]
+    assert set(state.subscriptions_by_kind) == {1}
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from aether.crypto import compute_event_id, event_id_from_dict, generate_keypair, sign, verify
+from blake3 import blake3
+
+from aether.crypto import compute_event_id, event_id_from_dict, event_ids_from_dicts, generate_keypair, sign, verify
 from aether.keys import decode_private_bech32, decode_public_bech32, encode_private_bech32, encode_public_bech32
 
 
@@ -36,6 +38,21 @@ def test_event_id_from_dict_matches_compute() -> None:
     assert event_id == direct
 
 
+def test_event_ids_from_dicts_matches_single() -> None:
+    events = [
+        {"pubkey": b"\x01" * 32, "created_at": index, "kind": 1, "tags": [["t", str(index)]], "content": "hi"}
+        for index in range(3)
+    ]
+    assert event_ids_from_dicts(events) == [event_id_from_dict(event) for event in events]
+
+
+def test_event_id_is_independent_of_content_size() -> None:
+    pubkey = b"\x01" * 32
+    for content in (b"small", b"x" * 200_000):
+        expected = blake3(pubkey + (5).to_bytes(8, "big") + (1).to_bytes(2, "big") + b"\x00\x00" + content).digest()
+        assert compute_event_id(pubkey=pubkey, created_at=5, kind=1, tags=[], content=content) == expected
+
+
 def test_bech32_public_roundtrip() -> None:
     _, public_key = generate_keypair()
     encoded = encode_public_bech32(public_key)
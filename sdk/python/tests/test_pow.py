@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from aether.pow import compute_pow_nonce, meets_difficulty
+from blake3 import blake3
+
+from aether.pow import compute_pow_nonce, leading_zero_bits, meets_difficulty
 
 
 def test_compute_pow_nonce_meets_difficulty() -> None:
@@ -16,3 +18,25 @@ def test_compute_pow_nonce_meets_difficulty() -> None:
     )
     assert nonce >= 0
     assert meets_difficulty(event_id, 4)
+
+
+def test_compute_pow_nonce_matches_full_payload_hash() -> None:
+    pubkey = b"\x02" * 32
+    tags = b"\x00\x00"
+    nonce, event_id = compute_pow_nonce(
+        pubkey=pubkey,
+        created_at=7,
+        kind=1,
+        tags=tags,
+        content=b"hi",
+        difficulty=6,
+    )
+    payload = pubkey + (7).to_bytes(8, "big") + (1).to_bytes(2, "big") + tags + b"hi" + nonce.to_bytes(8, "big")
+    assert event_id == blake3(payload).digest()
+
+
+def test_leading_zero_bits() -> None:
+    assert leading_zero_bits(b"") == 0
+    assert leading_zero_bits(b"\x00\x00") == 16
+    assert leading_zero_bits(b"\x00\x10") == 11
+    assert leading_zero_bits(b"\x80" + b"\x00" * 31) == 0